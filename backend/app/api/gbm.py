@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from typing import List
 from backend.app.solvers.gbm import simulate_gbm
@@ -31,6 +32,6 @@ def get_gbm_paths(params: GBMInput):
             dt=params.dt,
             n_paths=params.n_paths
         )
-        return result
+        return ORJSONResponse(content=result)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
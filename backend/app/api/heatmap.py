@@ -1,7 +1,12 @@
+import orjson
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
-from typing import List, Literal, Optional
+from typing import Any, AsyncIterator, List, Literal, Optional
 from backend.app.solvers.heat_fd import solve_heat
+from backend.app.cache import is_reproducible, request_key, response_cache
+from backend.app.encoding import decode_array
+from backend.app.workers import run_in_process
 
 router = APIRouter()
 
@@ -12,29 +17,76 @@ class HeatInput(BaseModel):
     t_steps: int = Field(..., gt=0, description="Number of time steps")
     domain: float = Field(1.0, gt=0, description="Length of spatial domain")
     init: Literal["pulse", "sin", "random"] = "pulse"
-    current_state: Optional[List[float]] = Field(None, description="Custom initial state for resuming simulation")
+    # List, base64 float32 bytes or a {"shape", "data"} envelope, decoded in the endpoint
+    current_state: Optional[Any] = Field(None, description="Custom initial state for resuming simulation")
     sigma: float = Field(0.0, ge=0.0, description="Noise strength")
+    seed: Optional[int] = Field(None, description="Noise seed; omit for a fresh draw")
     snapshot_interval: int = Field(1, ge=1, description="Save every Nth frame")
 
 class HeatResponse(BaseModel):
     frames: List[List[float]]
     energy: List[float]
 
+async def _stream_result(result: dict, cache_key: Optional[bytes] = None) -> AsyncIterator[bytes]:
+    """Yield the response JSON one frame at a time instead of as a single body."""
+    # With a cache key, the chunks are also collected and stored once complete,
+    # unless they outgrow the cache's size limit
+    parts: Optional[List[bytes]] = [] if cache_key is not None else None
+    size = 0
+
+    def emit(chunk: bytes) -> bytes:
+        nonlocal parts, size
+        if parts is not None:
+            size += len(chunk)
+            if size > response_cache.max_bytes:
+                parts = None
+            else:
+                parts.append(chunk)
+        return chunk
+
+    yield emit(b'{"frames":[')
+    for i, row in enumerate(result["frames"]):
+        if i:
+            yield emit(b",")
+        yield emit(orjson.dumps(row, option=orjson.OPT_SERIALIZE_NUMPY))
+    yield emit(b'],"energy":')
+    yield emit(orjson.dumps(result["energy"], option=orjson.OPT_SERIALIZE_NUMPY))
+    yield emit(b"}")
+
+    if parts is not None:
+        response_cache.set(cache_key, b"".join(parts))
+
 @router.post("/solve", response_model=HeatResponse)
-def solve_heat_equation(params: HeatInput):
+async def solve_heat_equation(params: HeatInput):
+    cacheable = is_reproducible(params.sigma, params.seed, resumed=params.current_state is not None)
+    if cacheable:
+        key = request_key("heat", params)
+        cached = response_cache.get(key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
     try:
-        result = solve_heat(
+        init_state = None
+        if params.current_state is not None:
+            init_state = decode_array(params.current_state)
+
+        result = await run_in_process(
+            solve_heat,
             alpha=params.alpha,
             dt=params.dt,
             dx=params.dx,
             t_steps=params.t_steps,
             domain=params.domain,
             init=params.init,
-            init_state=params.current_state,
+            init_state=init_state,
             sigma=params.sigma,
+            seed=params.seed,
             snapshot_interval=params.snapshot_interval,
-            return_as_list=True
+            return_as_list=False
+        )
+        # Stream frame by frame: long runs reach tens of MB of JSON
+        return StreamingResponse(
+            _stream_result(result, key if cacheable else None),
+            media_type="application/json",
         )
-        return result
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from typing import Literal, List, Dict
 from backend.app.solvers.hedging import simulate_delta_hedging
@@ -38,6 +39,6 @@ def simulate_hedging_endpoint(params: HedgingInput):
             option_type=params.option_type,
             rebalance_freq=params.rebalance_freq
         )
-        return result
+        return ORJSONResponse(content=result)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
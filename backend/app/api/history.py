@@ -1,7 +1,8 @@
 from typing import List
 from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, select
 from backend.app import models, schemas, database
 from backend.app.api.auth import get_current_user
 
@@ -13,16 +14,17 @@ def get_history(
     current_user: models.User = Depends(get_current_user),
     db: Session = Depends(database.get_db)
 ):
-    # Fetch last 10 entries for this user & sim_type
-    history = (
-        db.query(models.SimulationHistory)
-        .filter(models.SimulationHistory.user_id == current_user.id)
-        .filter(models.SimulationHistory.simulation_type == sim_type)
-        .order_by(desc(models.SimulationHistory.timestamp))
+    # Fetch last 10 entries for this user & sim_type as plain rows: no ORM
+    # hydration, and no HistoryResponse validation (the model documents the schema)
+    History = models.SimulationHistory
+    rows = db.execute(
+        select(History.id, History.simulation_type, History.parameters, History.timestamp)
+        .where(History.user_id == current_user.id)
+        .where(History.simulation_type == sim_type)
+        .order_by(desc(History.timestamp))
         .limit(10)
-        .all()
-    )
-    return history
+    ).all()
+    return ORJSONResponse([dict(row._mapping) for row in rows])
 
 @router.post("/", response_model=schemas.HistoryResponse)
 def create_history(
@@ -30,25 +32,20 @@ def create_history(
     current_user: models.User = Depends(get_current_user),
     db: Session = Depends(database.get_db)
 ):
-    # Check current count to enforce limit of 10
-    count = (
-        db.query(models.SimulationHistory)
+    # Enforce limit of 10: keep the 9 newest entries in a single DELETE, then insert
+    stale = (
+        db.query(models.SimulationHistory.id)
         .filter(models.SimulationHistory.user_id == current_user.id)
         .filter(models.SimulationHistory.simulation_type == item.simulation_type)
-        .count()
+        .order_by(desc(models.SimulationHistory.timestamp))
+        .offset(9)
+        .subquery()
+    )
+    (
+        db.query(models.SimulationHistory)
+        .filter(models.SimulationHistory.id.in_(select(stale.c.id)))
+        .delete(synchronize_session=False)
     )
-
-    if count >= 10:
-        # Delete oldest
-        oldest = (
-            db.query(models.SimulationHistory)
-            .filter(models.SimulationHistory.user_id == current_user.id)
-            .filter(models.SimulationHistory.simulation_type == item.simulation_type)
-            .order_by(models.SimulationHistory.timestamp.asc())
-            .first()
-        )
-        if oldest:
-            db.delete(oldest)
 
     new_history = models.SimulationHistory(
         user_id=current_user.id,
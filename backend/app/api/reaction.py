@@ -1,7 +1,10 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
-from typing import List, Dict
+from typing import Any, List, Dict, Optional
 from backend.app.solvers.reaction_diffusion import solve_reaction_diffusion
+from backend.app.encoding import decode_array
+from backend.app.workers import run_in_process
 
 router = APIRouter()
 
@@ -11,14 +14,17 @@ class ReactionInput(BaseModel):
     F: float = Field(0.035, description="Feed rate", ge=0.0, le=0.5)
     k: float = Field(0.060, description="Kill rate", ge=0.0, le=0.5)
     sigma: float = Field(0.0, description="Noise intensity", ge=0.0, le=2.0)
+    seed: Optional[int] = Field(None, description="Seed for the initial perturbation and noise")
     T: float = Field(100.0, description="Total simulation time", gt=0.0, le=2000.0)
     dt: float = Field(1.0, description="Time step", gt=0.0) # Larger dt for reaction-diffusion (if stable) or smaller
     dx: float = Field(1.0, description="Spatial step", gt=0.0)
     init_type: str = Field("random_center", description="Initial condition")
     width: int = Field(64, description="Grid width", ge=10, le=256)
     height: int = Field(64, description="Grid height", ge=10, le=256)
-    current_u: List[List[float]] = Field(None, description="Previous U state")
-    current_v: List[List[float]] = Field(None, description="Previous V state")
+    # Nested lists, base64 float32 bytes or a {"shape", "data"} envelope,
+    # decoded in the endpoint rather than validated float by float
+    current_u: Optional[Any] = Field(None, description="Previous U state (nested list, base64 float32 or {shape, data})")
+    current_v: Optional[Any] = Field(None, description="Previous V state (nested list, base64 float32 or {shape, data})")
 
 class ReactionResponse(BaseModel):
     t: List[float]
@@ -27,13 +33,22 @@ class ReactionResponse(BaseModel):
     parameters: Dict[str, float]
 
 @router.post("/simulate", response_model=ReactionResponse)
-def simulate_reaction(input_data: ReactionInput):
+async def simulate_reaction(input_data: ReactionInput):
     """
     Simulate the 2D Stochastic Reaction-Diffusion System (Gray-Scott).
     Returns the time evolution of the U component (concentration).
     """
     try:
-        result = solve_reaction_diffusion(
+        current_u = None
+        current_v = None
+        grid_shape = (input_data.width, input_data.height)
+        if input_data.current_u is not None:
+            current_u = decode_array(input_data.current_u, grid_shape)
+        if input_data.current_v is not None:
+            current_v = decode_array(input_data.current_v, grid_shape)
+
+        result = await run_in_process(
+            solve_reaction_diffusion,
             Du=input_data.Du,
             Dv=input_data.Dv,
             F=input_data.F,
@@ -45,20 +60,13 @@ def simulate_reaction(input_data: ReactionInput):
             init_type=input_data.init_type,
             width=input_data.width,
             height=input_data.height,
-            current_u=input_data.current_u,
-            current_v=input_data.current_v
+            current_u=current_u,
+            current_v=current_v,
+            seed=input_data.seed
         )
         
-        # Filter response to reduce size? 
-        # The solver already decimates frames.
-        # Remove "V" from result to save bandwidth if frontend only shows U.
-        # But for full research vis, user might want V.
-        # Let's keep U only in pydantic model for now to start light, 
-        # as U+V for 50 frames of 64x64 is: 50 * 64 * 64 * 8 bytes * 2 ~ 3MB. Acceptable.
-        # The pydantic model above doesn't have V, so `result` having V won't validate or will strip it.
-        # Default behavior: Pydantic < 2.0 strips extras.
-        
-        return result
+        # The solver already decimates frames (~50 max), so U+V for 64x64 is ~3MB. Acceptable.
+        return ORJSONResponse(content=result)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
 from backend.app.solvers.monte_carlo import run_parameter_sweep
+from backend.app.workers import run_in_process
 
 router = APIRouter()
 
@@ -21,7 +22,7 @@ class UQResponse(BaseModel):
     timing: float
 
 @router.post("/simulate", response_model=UQResponse)
-def simulate_uq(input_data: UQInput):
+async def simulate_uq(input_data: UQInput):
     """
     Run Monte Carlo Uncertainty Quantification.
     """
@@ -31,7 +32,9 @@ def simulate_uq(input_data: UQInput):
             k: [v.min, v.max] for k, v in input_data.param_ranges.items()
         }
         
-        result = run_parameter_sweep(
+        # Up to 10k samples: run off the event loop in the solver process pool
+        result = await run_in_process(
+            run_parameter_sweep,
             model_type=input_data.model_type,
             base_params=input_data.base_params,
             param_ranges=ranges_dict,
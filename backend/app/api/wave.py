@@ -1,7 +1,12 @@
+import orjson
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
-from typing import List
+from fastapi.responses import Response
+from pydantic import BaseModel, Field, model_validator
+from typing import Any, List, Optional
 from backend.app.solvers.wave_fd import solve_wave_equation
+from backend.app.cache import is_reproducible, request_key, response_cache
+from backend.app.encoding import decode_array
+from backend.app.workers import run_in_process
 
 router = APIRouter()
 
@@ -9,27 +14,55 @@ class WaveInput(BaseModel):
     c: float = Field(1.0, description="Wave speed", ge=0.1, le=10.0)
     damping: float = Field(0.0, description="Damping coefficient", ge=0.0, le=5.0)
     sigma: float = Field(0.0, description="Noise intensity", ge=0.0, le=20.0)
+    seed: Optional[int] = Field(None, description="Noise seed; omit for a fresh draw")
     T: float = Field(5.0, description="Total simulation time", gt=0.0, le=50.0)
     dt: float = Field(0.05, description="Time step", gt=0.0)
     dx: float = Field(0.1, description="Spatial step", gt=0.0)
     domain_len: float = Field(10.0, description="Length of the domain", gt=0.0)
     init_type: str = Field("pulse", description="Initial condition: 'pulse' or 'string'")
-    current_u: List[float] = Field(None, description="Current state (u) for resuming")
-    current_u_prev: List[float] = Field(None, description="Previous state (u_prev) for resuming")
+    snapshot_interval: int = Field(1, ge=1, description="Save every Nth frame")
+    antithetic: bool = Field(False, description="Also return the path driven by the negated noise")
+    # List, base64 float32 bytes or a {"shape", "data"} envelope, decoded in the endpoint
+    current_u: Optional[Any] = Field(None, description="Current state (u) for resuming")
+    current_u_prev: Optional[Any] = Field(None, description="Previous state (u_prev) for resuming")
+
+    @model_validator(mode="after")
+    def _check_grid(self):
+        # The solver needs at least one interior point (3 grid points)
+        if int(self.domain_len / self.dx) < 2:
+            raise ValueError("domain_len must be at least 2 * dx (3 grid points).")
+        return self
 
 class WaveResponse(BaseModel):
     x: List[float]
     t: List[float]
     frames: List[List[float]]
     energy: List[float]
+    frames_antithetic: Optional[List[List[float]]] = None
+    energy_antithetic: Optional[List[float]] = None
 
 @router.post("/simulate", response_model=WaveResponse)
-def simulate_wave(input_data: WaveInput):
+async def simulate_wave(input_data: WaveInput):
     """
     Simulate the 1D Stochastic Wave Equation.
     """
+    resumed = input_data.current_u is not None or input_data.current_u_prev is not None
+    cacheable = is_reproducible(input_data.sigma, input_data.seed, resumed)
+    if cacheable:
+        key = request_key("wave", input_data)
+        cached = response_cache.get(key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
     try:
-        result = solve_wave_equation(
+        current_u = None
+        current_u_prev = None
+        if input_data.current_u is not None:
+            current_u = decode_array(input_data.current_u)
+        if input_data.current_u_prev is not None:
+            current_u_prev = decode_array(input_data.current_u_prev)
+
+        result = await run_in_process(
+            solve_wave_equation,
             c=input_data.c,
             damping=input_data.damping,
             sigma=input_data.sigma,
@@ -38,10 +71,17 @@ def simulate_wave(input_data: WaveInput):
             dx=input_data.dx,
             domain_len=input_data.domain_len,
             init_type=input_data.init_type,
-            current_u=input_data.current_u,
-            current_u_prev=input_data.current_u_prev
+            current_u=current_u,
+            current_u_prev=current_u_prev,
+            seed=input_data.seed,
+            snapshot_interval=input_data.snapshot_interval,
+            antithetic=input_data.antithetic
         )
-        return result
+        # Serialized once so the same bytes can be cached
+        body = orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY)
+        if cacheable:
+            response_cache.set(key, body)
+        return Response(content=body, media_type="application/json")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -0,0 +1,77 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class TTLCache:
+    """
+    Thread-safe in-process cache for serialized responses.
+
+    Entries expire after `ttl` seconds; least recently used entries are evicted
+    once either `maxsize` entries or `max_bytes` of payload are held.
+    """
+
+    def __init__(self, ttl: float = 300.0, maxsize: int = 64, max_bytes: int = 64 * 1024 * 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._data: "OrderedDict[bytes, tuple[float, bytes]]" = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                self._pop(key)
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: bytes, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._data:
+                self._pop(key)
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._nbytes += len(value)
+            while len(self._data) > self.maxsize or self._nbytes > self.max_bytes:
+                self._pop(next(iter(self._data)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._nbytes = 0
+
+    def _pop(self, key: bytes) -> None:
+        _, value = self._data.pop(key)
+        self._nbytes -= len(value)
+
+
+def request_key(route: str, params: BaseModel) -> bytes:
+    """Cache key from the route and the canonical JSON of the validated input."""
+    return hashlib.blake2b(
+        route.encode() + b"\0" + params.model_dump_json().encode(), digest_size=16
+    ).digest()
+
+
+def is_reproducible(sigma: float, seed: Optional[int], resumed: bool) -> bool:
+    """
+    Whether a simulation request always produces the same response.
+
+    Deterministic (sigma == 0) and seeded runs do and can be cached; resumed
+    runs and unseeded noisy runs are unique.
+    """
+    return not resumed and (sigma == 0.0 or seed is not None)
+
+
+# Shared cache for full simulation responses (pre-serialized JSON bytes)
+response_cache = TTLCache()
@@ -0,0 +1,47 @@
+import base64
+import binascii
+from math import prod
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+
+def _decode_float32(data: str, shape: Optional[Tuple[int, ...]]) -> np.ndarray:
+    try:
+        raw = base64.b64decode(data, validate=True)
+    except binascii.Error as e:
+        raise ValueError(f"Invalid base64 array: {e}") from None
+    if len(raw) % 4:
+        raise ValueError("Base64 array must hold float32 values (byte length not a multiple of 4).")
+    arr = np.frombuffer(raw, dtype="<f4")
+    if shape is not None:
+        if arr.size != prod(shape):
+            raise ValueError(f"Base64 array has {arr.size} values, expected shape {shape}.")
+        arr = arr.reshape(shape)
+    return arr.astype(np.float64)
+
+
+def decode_array(value: Any, shape: Optional[Tuple[int, ...]] = None) -> np.ndarray:
+    """
+    Convert a resume-state field from a request body to a float64 array.
+
+    Accepts a (nested) list of numbers, a base64 string of raw little-endian
+    float32 values, or an envelope {"shape": [...], "data": "<base64>"} that
+    carries its own shape. The base64 forms are decoded with a single copy and
+    reshaped (an envelope's shape must match `shape` when both are given).
+    Raises ValueError on malformed input so endpoints can report it as a 400.
+    """
+    if isinstance(value, dict):
+        try:
+            data = value["data"]
+            own_shape = tuple(int(n) for n in value["shape"])
+        except (KeyError, TypeError, ValueError):
+            raise ValueError('Encoded array must be {"shape": [int, ...], "data": "<base64>"}.') from None
+        if not isinstance(data, str):
+            raise ValueError("Encoded array data must be a base64 string.")
+        if shape is not None and own_shape != tuple(shape):
+            raise ValueError(f"Encoded array has shape {own_shape}, expected {tuple(shape)}.")
+        return _decode_float32(data, own_shape)
+    if isinstance(value, str):
+        return _decode_float32(value, shape)
+    return np.asarray(value, dtype=np.float64)
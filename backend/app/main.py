@@ -1,8 +1,9 @@
 # Force Reload
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from backend.app.api import heatmap, gbm, pricing, hedging, wave, reaction, uq, auth, history
-from backend.app import models, database
+from backend.app import models, database, workers
 
 # Create Tables safely
 try:
@@ -10,7 +11,10 @@ try:
 except Exception as e:
     print(f"Warning: Database table creation failed (possibly locked): {e}")
 
-app = FastAPI()
+# orjson serializes numpy arrays natively (OPT_SERIALIZE_NUMPY), so solvers can hand back ndarrays.
+# Simulation endpoints return responses directly, skipping response_model re-validation of
+# every float; their models only document the schema.
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Enable CORS for frontend communication
 app.add_middleware(
@@ -32,6 +36,18 @@ app.include_router(reaction.router, prefix="/api/v1/reaction", tags=["Reaction-D
 app.include_router(uq.router, prefix="/api/v1/uq", tags=["Uncertainty Quantification"])
 
 
+@app.on_event("startup")
+def _start_workers():
+    # GBM runs in-process; warm its kernels here, pool workers warm their own
+    workers.warmup_in_process()
+    workers.get_executor()
+
+
+@app.on_event("shutdown")
+def _stop_workers():
+    workers.shutdown_executor()
+
+
 @app.get("/")
 def read_root():
     return {"message": "Welcome to StochLab API"}
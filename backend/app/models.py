@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from backend.app.database import Base
@@ -18,9 +18,14 @@ class SimulationHistory(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
-    simulation_type = Column(String, index=True) # e.g., 'gbm', 'heat_eq'
+    simulation_type = Column(String) # e.g., 'gbm', 'heat_eq'
     parameters = Column(Text) # JSON string of params
     timestamp = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
     owner = relationship("User", back_populates="history")
+
+    # Serves get_history's filter + ORDER BY timestamp DESC LIMIT 10 as one index range scan
+    __table_args__ = (
+        Index("ix_history_user_type_ts", "user_id", "simulation_type", "timestamp"),
+    )
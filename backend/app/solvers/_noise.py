@@ -0,0 +1,39 @@
+"""
+Pre-drawn Gaussian noise for the stochastic PDE solvers.
+
+Drawing one standard-normal array per time step pays the Generator call
+overhead every step; drawing everything up front can be hundreds of MB for
+2D grids. `noise_steps` draws blocks of up to ~_BLOCK_BYTES at a time and
+hands them out one step at a time.
+
+The Numba kernels take an empty array in place of the noise for
+deterministic steps and skip the noise term when it is empty, so every
+solver keeps one compiled signature for both cases.
+"""
+from math import prod
+from typing import Iterator, Tuple
+
+import numpy as np
+
+_BLOCK_BYTES = 8 * 1024 * 1024
+
+
+def noise_steps(
+    rng: np.random.Generator,
+    n_steps: int,
+    shape: Tuple[int, ...],
+    scale: float,
+    dtype=np.float64,
+) -> Iterator[np.ndarray]:
+    """
+    Yield `n_steps` arrays of shape `shape` holding scale * N(0, 1) draws.
+
+    The yielded arrays are views into a shared block; consume each one before
+    advancing the iterator.
+    """
+    per_step = max(1, prod(shape) * np.dtype(dtype).itemsize)
+    block = max(1, _BLOCK_BYTES // per_step)
+    for start in range(0, n_steps, block):
+        buf = rng.standard_normal((min(block, n_steps - start),) + tuple(shape), dtype=dtype)
+        buf *= scale
+        yield from buf
@@ -0,0 +1,21 @@
+"""
+Optional Numba support for the solver kernels.
+
+Every solver keeps a pure NumPy path, so Numba is only needed for the
+JIT-compiled fast path. Kernels are decorated with `njit` from here and only
+dispatched when NUMBA_AVAILABLE is True; without Numba the decorator is a
+no-op so the modules still import.
+"""
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        # Support both @njit and @njit(...) forms
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+    prange = range
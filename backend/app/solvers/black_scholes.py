@@ -1,7 +1,49 @@
-import numpy as np
-from scipy.stats import norm
+from functools import lru_cache
+from math import erfc, exp, log, sqrt, pi
 from typing import Dict, Union
 
+import numpy as np
+from scipy.special import ndtr
+
+from backend.app.solvers._numba import NUMBA_AVAILABLE, njit, prange
+
+try:
+    import numexpr as ne
+except ImportError:  # pragma: no cover - depends on the environment
+    ne = None
+
+_INV_SQRT2 = 1.0 / sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / sqrt(2.0 * pi)
+
+# Below this many elements numexpr's dispatch overhead outweighs its
+# fused multi-threaded evaluation, so plain NumPy is used.
+_NUMEXPR_MIN_SIZE = 4096
+
+
+def _ncdf(x: float) -> float:
+    """Standard normal CDF for a scalar (erfc form, like scipy.special.ndtr)."""
+    # erfc avoids the cancellation in 1 + erf(x) deep in the left tail
+    return 0.5 * erfc(-x * _INV_SQRT2)
+
+
+def _ncdf_fast(x: np.ndarray) -> np.ndarray:
+    """
+    Polynomial approximation of the standard normal CDF for arrays.
+
+    Abramowitz & Stegun 26.2.17, absolute error below 7.5e-8: one exp and a
+    handful of multiply-adds instead of a full-precision erfc.
+    """
+    k = 1.0 / (1.0 + 0.2316419 * np.abs(x))
+    w = k * (0.319381530 + k * (-0.356563782 + k * (1.781477937 + k * (-1.821255978 + k * 1.330274429))))
+    y = 1.0 - _INV_SQRT_2PI * np.exp(-0.5 * x * x) * w
+    return np.where(x >= 0, y, 1.0 - y)
+
+
+def _npdf(x: float) -> float:
+    """Standard normal PDF for a scalar."""
+    return _INV_SQRT_2PI * exp(-0.5 * x * x)
+
+
 def calculate_black_scholes(
     *,
     S: float,
@@ -44,6 +86,24 @@ def calculate_black_scholes(
             "rho": float
         }
     """
+    # Keyed on the exact inputs: repeated requests hit the cache, and the
+    # key never changes the value that is validated and priced
+    result = _bs_cached(
+        float(S), float(K), float(T), float(r), float(sigma), float(q), option_type.lower()
+    )
+    # Copy so callers can't mutate the cached entry
+    return dict(result)
+
+
+def _calculate_black_scholes_impl(
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float,
+    q: float,
+    option_type: str
+) -> Dict[str, float]:
     # Validation
     if S <= 0 or K <= 0 or sigma <= 0 or T <= 0:
         # Return zeros or Handle edge cases?
@@ -54,59 +114,48 @@ def calculate_black_scholes(
         if S <= 0 or K <= 0 or sigma <= 0:
              raise ValueError("S, K, and sigma must be positive.")
 
-    option_type = option_type.lower()
     if option_type not in ["call", "put"]:
         raise ValueError("Option type must be 'call' or 'put'.")
 
+    # Common terms, computed once and shared by both branches
+    sqrt_T = sqrt(T)
+    sigma_sqrt_T = sigma * sqrt_T
+    exp_mrT = exp(-r * T)
+    exp_mqT = exp(-q * T)
+    disc_K = K * exp_mrT
+    disc_S = S * exp_mqT
+
     # D1 and D2 calculation
-    d1 = (np.log(S / K) + (r - q + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-    d2 = d1 - sigma * np.sqrt(T)
+    d1 = (log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / sigma_sqrt_T
+    d2 = d1 - sigma_sqrt_T
 
     # CDF and PDF
-    N_d1 = norm.cdf(d1)
-    N_d2 = norm.cdf(d2)
-    N_minus_d1 = norm.cdf(-d1)
-    N_minus_d2 = norm.cdf(-d2)
-    n_d1 = norm.pdf(d1) # Standard normal PDF
-
-    # Pricing and Greeks
-    price = 0.0
-    delta = 0.0
-    gamma = 0.0
-    theta = 0.0
-    vega = 0.0
-    rho = 0.0
-
-    # Common terms
-    sqrt_T = np.sqrt(T)
-    disc_K = K * np.exp(-r * T)
-    disc_S = S * np.exp(-q * T)
-    
+    N_d1 = _ncdf(d1)
+    N_d2 = _ncdf(d2)
+    n_d1 = _npdf(d1) # Standard normal PDF
+
+    # Theta term shared by call and put
+    theta_decay = -(disc_S * n_d1 * sigma) / (2 * sqrt_T)
+
     if option_type == "call":
         price = disc_S * N_d1 - disc_K * N_d2
-        delta = np.exp(-q * T) * N_d1
-        rho = K * T * np.exp(-r * T) * N_d2
-        
-        # Theta for Call
-        term1 = - (S * np.exp(-q * T) * n_d1 * sigma) / (2 * sqrt_T)
-        term2 = - r * K * np.exp(-r * T) * N_d2
-        term3 = + q * S * np.exp(-q * T) * N_d1
-        theta = term1 + term2 + term3
-        
+        delta = exp_mqT * N_d1
+        rho = T * disc_K * N_d2
+        theta = theta_decay - r * disc_K * N_d2 + q * disc_S * N_d1
+
     else: # put
+        # N(-x) from erfc directly: 1 - N(x) cancels in the tail and can
+        # price deep out-of-the-money puts slightly negative
+        N_minus_d1 = _ncdf(-d1)
+        N_minus_d2 = _ncdf(-d2)
         price = disc_K * N_minus_d2 - disc_S * N_minus_d1
-        delta = np.exp(-q * T) * (N_d1 - 1)
-        rho = -K * T * np.exp(-r * T) * N_minus_d2
-        
-        # Theta for Put
-        term1 = - (S * np.exp(-q * T) * n_d1 * sigma) / (2 * sqrt_T)
-        term2 = + r * K * np.exp(-r * T) * N_minus_d2
-        term3 = - q * S * np.exp(-q * T) * N_minus_d1
-        theta = term1 + term2 + term3
+        delta = exp_mqT * (N_d1 - 1)
+        rho = -T * disc_K * N_minus_d2
+        theta = theta_decay + r * disc_K * N_minus_d2 - q * disc_S * N_minus_d1
 
     # Gamma and Vega are the same for Call and Put (adjusted for q)
-    gamma = (np.exp(-q * T) * n_d1) / (S * sigma * sqrt_T)
-    vega = S * np.exp(-q * T) * sqrt_T * n_d1
+    gamma = (exp_mqT * n_d1) / (S * sigma_sqrt_T)
+    vega = disc_S * sqrt_T * n_d1
 
     return {
         "price": float(price),
@@ -117,6 +166,9 @@ def calculate_black_scholes(
         "rho": float(rho)
     }
 
+_bs_cached = lru_cache(maxsize=4096)(_calculate_black_scholes_impl)
+
+
 def _calculate_intrinsic(S, K, option_type):
     if option_type == "call":
         val = max(0, S - K)
@@ -133,3 +185,188 @@ def _calculate_intrinsic(S, K, option_type):
         "vega": 0.0,
         "rho": 0.0
     }
+
+
+def _split_expired(S, K, T, sigma):
+    """
+    Mask the expired (T <= 0) samples and validate the rest.
+
+    As in `calculate_black_scholes`, expired samples are worth intrinsic value
+    and are not validated. Returns the mask and (S, K, T, sigma) with expired
+    entries set to 1.0 so the formula can be evaluated on the whole batch.
+    """
+    expired = T <= 0
+    if np.any(~expired & ((S <= 0) | (K <= 0) | (sigma <= 0))):
+        raise ValueError("S, K, and sigma must be positive.")
+    if expired.any():
+        S, K, T, sigma = (np.where(expired, 1.0, v) for v in (S, K, T, sigma))
+    return expired, S, K, T, sigma
+
+
+def _intrinsic_batch(S, K, option_type):
+    """Array counterpart of `_calculate_intrinsic`: price and delta at expiry."""
+    if option_type == "call":
+        return np.maximum(S - K, 0.0), np.where(S > K, 1.0, 0.0)
+    return np.maximum(K - S, 0.0), np.where(S < K, -1.0, 0.0)
+
+
+def calculate_black_scholes_batch(
+    *,
+    S: Union[float, np.ndarray],
+    K: Union[float, np.ndarray],
+    T: Union[float, np.ndarray],
+    r: Union[float, np.ndarray],
+    sigma: Union[float, np.ndarray],
+    q: Union[float, np.ndarray] = 0.0,
+    option_type: str = "call",
+    fast_math: bool = False
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized Black-Scholes price and Greeks over arrays of inputs.
+
+    Inputs are broadcast against each other, so any mix of scalars and
+    equally-shaped arrays works (e.g. a sweep over sampled S and sigma with
+    fixed K, T, r). Same formulas as `calculate_black_scholes`, evaluated once
+    on whole arrays with `scipy.special.ndtr` instead of per-element calls.
+
+    Parameters
+    ----------
+    S, K, T, r, sigma, q : float or np.ndarray
+        Same meaning as in `calculate_black_scholes`. Samples with T <= 0 get
+        their intrinsic value (zero gamma, theta, vega and rho).
+    option_type : str
+        "call" or "put" (applies to the whole batch).
+    fast_math : bool
+        Use a polynomial CDF approximation (absolute error < 7.5e-8) instead
+        of `ndtr`. Good enough for display and sweep statistics.
+
+    Returns
+    -------
+    dict
+        {"price", "delta", "gamma", "theta", "vega", "rho"} -> np.ndarray
+    """
+    S_in, K_in, T, r, sigma, q = np.broadcast_arrays(
+        *(np.asarray(v, dtype=np.float64) for v in (S, K, T, r, sigma, q))
+    )
+    expired, S, K, T, sigma = _split_expired(S_in, K_in, T, sigma)
+
+    option_type = option_type.lower()
+    if option_type not in ["call", "put"]:
+        raise ValueError("Option type must be 'call' or 'put'.")
+
+    sqrt_T = np.sqrt(T)
+    sigma_sqrt_T = sigma * sqrt_T
+
+    if ne is not None and S.size >= _NUMEXPR_MIN_SIZE:
+        # Fused transcendentals: one multi-threaded pass per expression
+        d1 = ne.evaluate("(log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / sigma_sqrt_T")
+        d2 = ne.evaluate("d1 - sigma_sqrt_T")
+        n_d1 = ne.evaluate("0.3989422804014327 * exp(-0.5 * d1 * d1)")
+        exp_mrT = ne.evaluate("exp(-r * T)")
+        exp_mqT = ne.evaluate("exp(-q * T)")
+    else:
+        d1 = (np.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / sigma_sqrt_T
+        d2 = d1 - sigma_sqrt_T
+        n_d1 = _INV_SQRT_2PI * np.exp(-0.5 * d1 * d1)
+        exp_mrT = np.exp(-r * T)
+        exp_mqT = np.exp(-q * T)
+
+    ncdf = _ncdf_fast if fast_math else ndtr
+    N_d1 = ncdf(d1)
+    N_d2 = ncdf(d2)
+
+    disc_K = K * exp_mrT
+    disc_S = S * exp_mqT
+    theta_decay = -(disc_S * n_d1 * sigma) / (2 * sqrt_T)
+
+    if option_type == "call":
+        price = disc_S * N_d1 - disc_K * N_d2
+        delta = exp_mqT * N_d1
+        rho = T * disc_K * N_d2
+        theta = theta_decay - r * disc_K * N_d2 + q * disc_S * N_d1
+    else: # put
+        N_minus_d1 = ncdf(-d1)
+        N_minus_d2 = ncdf(-d2)
+        price = disc_K * N_minus_d2 - disc_S * N_minus_d1
+        delta = exp_mqT * (N_d1 - 1)
+        rho = -T * disc_K * N_minus_d2
+        theta = theta_decay + r * disc_K * N_minus_d2 - q * disc_S * N_minus_d1
+
+    gamma = (exp_mqT * n_d1) / (S * sigma_sqrt_T)
+    vega = disc_S * sqrt_T * n_d1
+
+    if expired.any():
+        intrinsic_price, intrinsic_delta = _intrinsic_batch(S_in, K_in, option_type)
+        price = np.where(expired, intrinsic_price, price)
+        delta = np.where(expired, intrinsic_delta, delta)
+        gamma, theta, vega, rho = (np.where(expired, 0.0, v) for v in (gamma, theta, vega, rho))
+
+    return {
+        "price": price,
+        "delta": delta,
+        "gamma": gamma,
+        "theta": theta,
+        "vega": vega,
+        "rho": rho
+    }
+
+
+@njit(parallel=True, cache=True)
+def _bs_price_kernel(S, K, T, r, sigma, q, is_call, out):
+    """
+    Black-Scholes prices (no Greeks) for independent samples in one fused
+    prange pass, with the normal CDF inlined as 0.5 * erfc(-x / sqrt 2).
+    """
+    for i in prange(out.shape[0]):
+        sigma_sqrt_T = sigma[i] * sqrt(T[i])
+        d1 = (log(S[i] / K[i]) + (r[i] - q[i] + 0.5 * sigma[i] * sigma[i]) * T[i]) / sigma_sqrt_T
+        d2 = d1 - sigma_sqrt_T
+        disc_S = S[i] * exp(-q[i] * T[i])
+        disc_K = K[i] * exp(-r[i] * T[i])
+        if is_call:
+            out[i] = disc_S * 0.5 * erfc(-d1 * _INV_SQRT2) - disc_K * 0.5 * erfc(-d2 * _INV_SQRT2)
+        else:
+            out[i] = disc_K * 0.5 * erfc(d2 * _INV_SQRT2) - disc_S * 0.5 * erfc(d1 * _INV_SQRT2)
+
+
+def calculate_black_scholes_price_batch(
+    *,
+    S: Union[float, np.ndarray],
+    K: Union[float, np.ndarray],
+    T: Union[float, np.ndarray],
+    r: Union[float, np.ndarray],
+    sigma: Union[float, np.ndarray],
+    q: Union[float, np.ndarray] = 0.0,
+    option_type: str = "call"
+) -> np.ndarray:
+    """
+    Vectorized Black-Scholes price (no Greeks) over arrays of inputs.
+
+    Same broadcasting and validation as `calculate_black_scholes_batch`. With
+    Numba the samples are priced in parallel by `_bs_price_kernel`; otherwise
+    this falls back to the NumPy batch.
+
+    Returns
+    -------
+    np.ndarray
+        Prices, with the broadcast shape of the inputs.
+    """
+    option_type = option_type.lower()
+    if not NUMBA_AVAILABLE:
+        return calculate_black_scholes_batch(
+            S=S, K=K, T=T, r=r, sigma=sigma, q=q, option_type=option_type
+        )["price"]
+
+    arrays = np.broadcast_arrays(
+        *(np.asarray(v, dtype=np.float64) for v in (S, K, T, r, sigma, q))
+    )
+    S_in, K_in, T, r, sigma, q = (np.ascontiguousarray(a).reshape(-1) for a in arrays)
+    expired, S, K, T, sigma = _split_expired(S_in, K_in, T, sigma)
+    if option_type not in ["call", "put"]:
+        raise ValueError("Option type must be 'call' or 'put'.")
+
+    out = np.empty(S.shape[0])
+    _bs_price_kernel(S, K, T, r, sigma, q, option_type == "call", out)
+    if expired.any():
+        out = np.where(expired, _intrinsic_batch(S_in, K_in, option_type)[0], out)
+    return out.reshape(arrays[0].shape)
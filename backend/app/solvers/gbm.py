@@ -1,5 +1,27 @@
+import math
 import numpy as np
-from typing import Dict, List, Union
+from backend.app.solvers._numba import NUMBA_AVAILABLE, njit, prange
+from typing import Dict
+
+# PCG64 generator shared by all calls (faster than the legacy global MT19937)
+_rng = np.random.default_rng()
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _gbm_kernel(S0, mu, sigma, dt, N, n_paths, Z, out):
+    """
+    Fill `out` (n_paths, N+1) with GBM paths driven by standard normals `Z` (n_paths, N).
+    Accumulates log S incrementally so drift, diffusion and exp are fused into one pass.
+    """
+    drift = (mu - 0.5 * sigma * sigma) * dt
+    diff = sigma * math.sqrt(dt)
+    for p in prange(n_paths):
+        logS = math.log(S0)
+        out[p, 0] = S0
+        for i in range(N):
+            logS += drift + diff * Z[p, i]
+            out[p, i + 1] = math.exp(logS)
+
 
 def simulate_gbm(
     *,
@@ -9,7 +31,7 @@ def simulate_gbm(
     T: float,
     dt: float,
     n_paths: int = 1
-) -> Dict[str, Union[List[float], List[List[float]]]]:
+) -> Dict[str, np.ndarray]:
     """
     Simulate Geometric Brownian Motion (GBM) paths.
     
@@ -35,8 +57,8 @@ def simulate_gbm(
     -------
     dict
         {
-            "time": List[float],    # Time points [0, dt, ..., T]
-            "paths": List[List[float]] # List of paths, where each path is a list of prices
+            "time": np.ndarray,    # Time points [0, dt, ..., T], shape (N+1,)
+            "paths": np.ndarray    # float32 price paths, shape (n_paths, N+1)
         }
     """
     
@@ -55,27 +77,29 @@ def simulate_gbm(
     t = np.linspace(0, T, N + 1)
     
     # Vectorized Simulation
-    # Generate random increment matrix (Paths x Steps)
-    # dW ~ N(0, dt) -> sqrt(dt) * N(0, 1)
-    dW = np.random.normal(0, np.sqrt(dt), size=(n_paths, N))
-    
-    # Cumulative sum for Brownian path W(t)
-    # Insert 0 at the beginning for t=0
-    W = np.cumsum(dW, axis=1)
-    W = np.hstack([np.zeros((n_paths, 1)), W])
-    
-    # Calculate exact solution for all paths at once
-    # S(t) = S0 * exp((mu - 0.5 * sigma^2) * t + sigma * W(t))
-    # Reshape t to broadcast: (1, Steps)
-    drift_term = (mu - 0.5 * sigma**2) * t.reshape(1, -1)
-    diffusion_term = sigma * W
+    # Standard normal draws (Paths x Steps), scaled by sqrt(dt) below.
+    # float32 halves the RNG bytes; accumulation happens in float64.
+    Z = _rng.standard_normal(size=(n_paths, N), dtype=np.float32)
     
-    S = S0 * np.exp(drift_term + diffusion_term)
+    # S(t) = S0 * exp((mu - 0.5 * sigma^2) * t + sigma * W(t)), written straight into S
+    S = np.empty((n_paths, N + 1))
+    if NUMBA_AVAILABLE:
+        _gbm_kernel(float(S0), float(mu), float(sigma), float(dt), N, n_paths, Z, S)
+    else:
+        # NumPy path: turn Z into per-step growth factors in place, then one cumprod
+        # into S[:, 1:] (no cumsum/hstack copies, single exp pass)
+        S[:, 0] = S0
+        np.multiply(Z, sigma * np.sqrt(dt), out=Z)
+        Z += (mu - 0.5 * sigma * sigma) * dt
+        np.exp(Z, out=Z)
+        np.cumprod(Z, axis=1, dtype=np.float64, out=S[:, 1:])
+        S[:, 1:] *= S0
     
-    # Rounding for JSON size optimization (optional but good for API)
-    S = np.round(S, 4)
+    # Downcast for the API payload: float32 halves the bytes and orjson emits
+    # shorter floats (display only, so ~7 significant digits is plenty)
+    S = S.astype(np.float32, copy=False)
     
     return {
-        "time": t.tolist(),
-        "paths": S.tolist()
+        "time": t,
+        "paths": S
     }
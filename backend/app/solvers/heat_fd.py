@@ -1,7 +1,30 @@
 # backend/app/solvers/heat_fd.py
 from __future__ import annotations
 import numpy as np
-from typing import Callable, List, Optional, Sequence, Union
+from typing import Callable, Dict, List, Optional, Union
+from backend.app.solvers._numba import NUMBA_AVAILABLE, njit, prange
+from backend.app.solvers._noise import noise_steps
+
+_NO_NOISE = np.zeros(0)
+
+
+# Explicit signature: compiled (or loaded from the cache) eagerly at import,
+# so no request pays type inference / compilation on its first call
+@njit("void(float64[::1], float64[::1], float64, float64[::1])", parallel=True, fastmath=True, cache=True)
+def _heat_step(u, u_next, r, noise):
+    """
+    One explicit heat step u -> u_next, stencil and pre-scaled interior noise
+    (length nx-2, or empty) fused into one pass; boundaries held at zero.
+    """
+    nx = u.shape[0]
+    has_noise = noise.shape[0] > 0
+    for i in prange(1, nx - 1):
+        val = u[i] + r * (u[i + 1] - 2.0 * u[i] + u[i - 1])
+        if has_noise:
+            val += noise[i - 1]
+        u_next[i] = val
+    u_next[0] = 0.0
+    u_next[nx - 1] = 0.0
 
 
 def _init_condition(x: np.ndarray, kind: str = "pulse") -> np.ndarray:
@@ -16,7 +39,11 @@ def _init_condition(x: np.ndarray, kind: str = "pulse") -> np.ndarray:
     if kind == "pulse":
         center = 0.5 * (x[0] + x[-1])
         width = 0.05 * (x[-1] - x[0]) or 0.05
-        return np.exp(-((x - center) ** 2) / (2 * width**2))
+        # exp(-(x - c)^2 / (2 w^2)) evaluated in place in one buffer
+        u = x - center
+        u *= u
+        u *= -1.0 / (2 * width * width)
+        return np.exp(u, out=u)
     if kind == "sin":
         return np.sin(2 * np.pi * (x - x[0]) / (x[-1] - x[0]))
     if kind == "random":
@@ -38,11 +65,12 @@ def solve_heat(
     sigma: float = 0.0,
     snapshot_interval: int = 1,
     return_as_list: bool = True,
+    seed: Optional[int] = None,
     progress_callback: Optional[Callable[[int, int], None]] = None,
-) -> Union[Dict[str, List], np.ndarray]:
+) -> Dict[str, Union[List, np.ndarray]]:
     """
     Solve 1D heat equation using explicit finite differences.
-    Returns dictionary with "frames" and "energy" if return_as_list=True.
+    Returns dictionary with "frames" and "energy".
         u^{n+1}_i = u^n_i + alpha * dt * (u^n_{i+1} - 2 u^n_i + u^n_{i-1}) / dx^2
 
     Parameters
@@ -68,15 +96,18 @@ def solve_heat(
     snapshot_interval : int
         Save every `snapshot_interval` time steps into frames.
     return_as_list : bool
-        If True, return frames as nested Python lists for JSON serialization.
+        If True, return frames as nested Python lists; otherwise as arrays
+        (float32 frames), for callers that serialize numpy directly.
+    seed : Optional[int]
+        Seed for the noise generator; None draws fresh entropy.
     progress_callback : Optional[callable]
         If provided, called as progress_callback(current_step, total_steps).
 
     Returns
     -------
-    result : Dict or np.ndarray
+    result : Dict
         If return_as_list=True: {"frames": [...], "energy": [...]}
-        Else: np.ndarray of frames
+        Else: {"frames": np.ndarray (n_frames, nx) float32, "energy": np.ndarray}
     """
     if dx <= 0 or dt <= 0:
         raise ValueError("dx and dt must be positive")
@@ -108,7 +139,7 @@ def solve_heat(
              if u.shape[0] != nx:
                   raise ValueError(f"init_state length {u.shape[0]} does not match domain/dx -> {nx}")
     else:
-        u = _init_condition(x, kind=init).astype(float)
+        u = _init_condition(x, kind=init).astype(float, copy=False)
         
     # enforce boundary conditions (Dirichlet zero)
     if bc == "dirichlet":
@@ -117,53 +148,66 @@ def solve_heat(
     else:
         raise ValueError("Only 'dirichlet' bc is supported for now")
 
-    frames: List[np.ndarray] = []
-    energy: List[float] = []
     if snapshot_interval <= 0:
         snapshot_interval = 1
 
+    # pre-allocate snapshot storage (frame count is known up front); array
+    # output is float32 for the payload, so write it in that dtype directly
+    n_frames = t_steps // snapshot_interval + 1
+    frames_arr = np.empty((n_frames, nx), dtype=np.float64 if return_as_list else np.float32)
+    energy_arr = np.empty(n_frames)
+
     # pre-allocate next array
     u_next = np.zeros_like(u)
 
     # store initial frame
-    frames.append(u.copy())
-    energy.append(np.sum(u**2) * dx)
+    frames_arr[0] = u
+    # u @ u is a single dot-product pass, no u**2 temporary
+    energy_arr[0] = (u @ u) * dx
+    frame_idx = 1
+
+    # Euler-Maruyama noise term: sigma * dW ~ sigma * sqrt(dt) * N(0,1) on the
+    # interior, drawn in blocks from a PCG64 generator rather than per step
+    noise_iter = None
+    if sigma > 0.0:
+        rng = np.random.default_rng(seed)
+        noise_iter = noise_steps(rng, t_steps, (nx - 2,), sigma * np.sqrt(dt))
 
     for n in range(1, t_steps + 1):
-        # interior points update
-        # vectorized finite-difference
-        u_next[1:-1] = (
-            u[1:-1]
-            + alpha * dt * (u[2:] - 2.0 * u[1:-1] + u[:-2]) / (dx * dx)
-        )
+        noise = next(noise_iter) if noise_iter is not None else None
+        if NUMBA_AVAILABLE:
+            _heat_step(u, u_next, r, noise if noise is not None else _NO_NOISE)
+        else:
+            # interior points update
+            # vectorized finite-difference
+            u_next[1:-1] = u[1:-1] + r * (u[2:] - 2.0 * u[1:-1] + u[:-2])
 
-        if sigma > 0.0:
-            # Euler-Maruyama noise term: sigma * dW ~ sigma * sqrt(dt) * N(0,1)
-            # Apply only to interior points? Physics often implies noise on the field itself.
-            noise = sigma * np.sqrt(dt) * np.random.standard_normal(size=nx-2)
-            u_next[1:-1] += noise
+            if noise is not None:
+                u_next[1:-1] += noise
 
-        # boundaries (dirichlet: zero)
-        u_next[0] = 0.0
-        u_next[-1] = 0.0
+            # boundaries (dirichlet: zero)
+            u_next[0] = 0.0
+            u_next[-1] = 0.0
 
         # swap
         u, u_next = u_next, u
 
         # optionally save snapshot
         if (n % snapshot_interval) == 0:
-            frames.append(u.copy())
-            energy.append(np.sum(u**2) * dx)
+            frames_arr[frame_idx] = u
+            energy_arr[frame_idx] = (u @ u) * dx
+            frame_idx += 1
 
         # progress callback
         if progress_callback is not None:
             progress_callback(n, t_steps)
 
-    frames_arr = np.vstack(frames)  # shape (n_frames, nx)
-
     if return_as_list:
         return {
             "frames": frames_arr.tolist(),
-            "energy": energy
+            "energy": energy_arr.tolist()
         }
-    return frames_arr
+    return {
+        "frames": frames_arr,  # shape (n_frames, nx)
+        "energy": energy_arr
+    }
@@ -1,7 +1,10 @@
+import math
 import numpy as np
-from scipy.stats import norm
-from typing import Dict, List, Literal
-from backend.app.solvers.black_scholes import calculate_black_scholes
+from typing import Dict, Literal
+from backend.app.solvers.black_scholes import calculate_black_scholes_batch
+
+# PCG64 generator for the simulated stock paths
+_rng = np.random.default_rng()
 
 def simulate_delta_hedging(
     *,
@@ -14,7 +17,7 @@ def simulate_delta_hedging(
     q: float = 0.0,
     option_type: Literal["call", "put"] = "call",
     rebalance_freq: str = "daily"  # daily, weekly
-) -> Dict[str, List[float]]:
+) -> Dict[str, np.ndarray]:
     """
     Simulate the P&L of a delta-hedged short option position.
     
@@ -47,96 +50,63 @@ def simulate_delta_hedging(
     # No, option pricing assumes S is ex-dividend price.
     # So drift of Price Process is (mu - q).
     
-    dW = np.random.normal(0, np.sqrt(dt), size=N)
-    W = np.cumsum(dW)
-    W = np.insert(W, 0, 0.0)
-    
     # Real-world drift of the STOCK PRICE itself involves dividend drop
     # S(t) drift is mu - q
     net_mu = mu - q
     
-    drift = (net_mu - 0.5 * sigma**2) * t_steps
-    diffusion = sigma * W
-    S = S0 * np.exp(drift + diffusion)
-    
-    # Vectors to store results
-    option_prices = np.zeros(N + 1)
-    deltas = np.zeros(N + 1)
-    pnls = np.zeros(N + 1)
-    
-    # Tracking Account
-    cash = 0.0
-    shares_held = 0.0
+    # log S accumulated from per-step log increments, written straight into
+    # the path array (no W / drift / diffusion intermediates)
+    log_S = np.empty(N + 1)
+    log_S[0] = 0.0
+    _rng.standard_normal(out=log_S[1:])
+    log_S[1:] *= sigma * math.sqrt(dt)
+    log_S[1:] += (net_mu - 0.5 * sigma**2) * dt
+    np.cumsum(log_S, out=log_S)
+    S = S0 * np.exp(log_S)
     
-    # Simulation Loop
-    for i in range(N + 1):
-        curr_t = t_steps[i]
-        curr_S = S[i]
-        time_to_maturity = T - curr_t
-        
-        # Calculate BS Price and Delta
-        # Use our robust solver
-        bs_res = calculate_black_scholes(
-            S=curr_S, K=K, T=max(time_to_maturity, 1e-6), r=r, sigma=sigma, q=q, option_type=option_type
-        )
-        curr_opt_val = bs_res['price']
-        curr_delta = bs_res['delta']
-        
-        if i == 0:
-            # Initial Setup: Shor Option (-), Long Delta Shares (+)
-            # Cash = Premium - Cost of Shares
-            premium_received = curr_opt_val
-            shares_held = curr_delta
-            cost_of_shares = shares_held * curr_S
-            
-            cash = premium_received - cost_of_shares
-            
-            # Initial PnL = 0
-            pnls[i] = 0.0
-            
-        else:
-            # 1. Accrue Interest on Cash
-            # Discrete compounding match dt
-            interest_earned = cash * (np.exp(r * dt) - 1)
-            cash += interest_earned
-            
-            # 2. Accrue Dividends on Shares Held
-            # If we hold shares, we receive continuous dividend yield q
-            # Cash += Shares * S * (exp(q*dt) - 1)
-            # dividend_received = shares_held * S[i-1] * (np.exp(q * dt) - 1)
-            # Or use approximation q * S * dt. Exponential is more rigorous.
-            # Note: We use previous price or average price? Continuous yield implies we earned it over the interval.
-            # Using S[i-1] (start of interval) is standard for forward Euler.
-            dividend_cash = shares_held * S[i-1] * (np.exp(q * dt) - 1)
-            cash += dividend_cash
-            
-            if i < N:
-                # Rebalance Hedge
-                shares_to_buy = curr_delta - shares_held
-                cost = shares_to_buy * curr_S
-                
-                cash -= cost
-                shares_held = curr_delta
-            else:
-                # Expiry Settlement
-                pass # We just mark to market below
+    # BS price and delta along the whole (pre-simulated) path in one batch call
+    tau = np.maximum(T - t_steps, 1e-6)
+    bs_res = calculate_black_scholes_batch(
+        S=S, K=K, T=tau, r=r, sigma=sigma, q=q, option_type=option_type
+    )
+    option_prices = bs_res["price"]
+    deltas = bs_res["delta"]
+
+    # Hedge held over each step: rebalanced to delta at every step except
+    # expiry, where the last position is just marked to market
+    shares_held = deltas.copy()
+    if N > 0:
+        shares_held[N] = shares_held[N - 1]
+
+    # Cash flows booked at each step (after interest on the prior balance):
+    # t=0: premium received minus initial share purchase;
+    # t>0: dividends on the shares held over the previous interval (forward
+    #      Euler, start-of-interval price) minus the cost of rebalancing
+    # expm1 keeps full precision for the tiny q*dt of a daily step
+    div_factor = math.expm1(q * dt)
+    flows = np.empty(N + 1)
+    flows[0] = option_prices[0] - shares_held[0] * S[0]
+    flows[1:] = (
+        shares_held[:-1] * S[:-1] * div_factor
+        - np.diff(shares_held) * S[1:]
+    )
+
+    # cash_i = cash_{i-1} * exp(r dt) + flow_i, solved in closed form:
+    # cash_i = g^i * sum_{k<=i} flow_k / g^k with g = exp(r dt)
+    growth = np.exp(r * dt * np.arange(N + 1))
+    cash = growth * np.cumsum(flows / growth)
 
-        # Record State
-        option_prices[i] = curr_opt_val
-        deltas[i] = curr_delta
-        
-        # Mark to Market PnL
-        # PnL = (Asset Value) - (Liability Value)
-        # Asset = Shares * S + Cash
-        # Liability = Option Value
-        portfolio_asset_value = shares_held * curr_S + cash
-        pnls[i] = portfolio_asset_value - curr_opt_val
+    # Mark to Market PnL
+    # PnL = (Asset Value) - (Liability Value)
+    # Asset = Shares * S + Cash
+    # Liability = Option Value
+    pnls = shares_held * S + cash - option_prices
 
     return {
-        "time": t_steps.tolist(),
-        "stock_price": S.tolist(),
-        "option_price": option_prices.tolist(),
-        "delta": deltas.tolist(),
-        "pnl": pnls.tolist()
+        "time": t_steps,
+        "stock_price": S,
+        "option_price": option_prices,
+        "delta": deltas,
+        "pnl": pnls
     }
 
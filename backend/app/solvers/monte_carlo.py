@@ -2,7 +2,10 @@ import numpy as np
 import time
 from typing import Callable, Dict, List, Any, Union
 from backend.app.solvers.gbm import simulate_gbm
-from backend.app.solvers.black_scholes import calculate_black_scholes
+from backend.app.solvers.black_scholes import calculate_black_scholes_price_batch
+
+# PCG64 generator for sampled parameters and noise
+_rng = np.random.default_rng()
 
 def run_parameter_sweep(
     model_type: str,
@@ -62,57 +65,47 @@ def run_parameter_sweep(
              final_prices = paths[:, -1].tolist()
              results = final_prices
         else:
-             # Slow path: Iterate and sample params
-             # This is "Sensitivity Analysis"
-             for _ in range(n_sims):
-                 # Sample parameters
-                 curr_sigma = sigma
-                 if "sigma" in param_ranges:
-                     curr_sigma = np.random.uniform(param_ranges["sigma"][0], param_ranges["sigma"][1])
-                 
-                 # Run single path
-                 res = simulate_gbm(S0=S0, mu=mu, sigma=curr_sigma, T=T, dt=dt, n_paths=1)
-                 results.append(res["paths"][0][-1])
+             # "Sensitivity Analysis": one sampled sigma per simulation, all
+             # simulations at once. Only S_T is kept, and under GBM
+             # log S_T = log S0 + (mu - sigma^2/2) t + sigma W_t with
+             # W_t ~ sqrt(t) N(0, 1), so a single draw per simulation gives
+             # the same distribution as stepping the full path.
+             sigmas = np.full(n_sims, sigma)
+             if "sigma" in param_ranges:
+                 sigmas = _rng.uniform(param_ranges["sigma"][0], param_ranges["sigma"][1], size=n_sims)
+             
+             t_end = int(T / dt) * dt  # same horizon as the stepped simulate_gbm grid
+             W = np.sqrt(t_end) * _rng.standard_normal(n_sims)
+             results = S0 * np.exp((mu - 0.5 * sigmas * sigmas) * t_end + sigmas * W)
 
     # 2. Option Pricing Distribution
     elif model_type == "pricing":
          # Black Scholes is deterministic given params.
          # So we MUST have param_ranges to get a distribution (Sensitivity).
          
-         S = base_params.get("S", 100.0)
-         K = base_params.get("K", 100.0)
-         T = base_params.get("T", 1.0)
-         r = base_params.get("r", 0.05)
-         sigma = base_params.get("sigma", 0.2)
          option_type = base_params.get("option_type", "call")
          
-         for _ in range(n_sims):
-             # Sample
-             curr_S = S
-             if "S" in param_ranges:
-                 curr_S = np.random.uniform(param_ranges["S"][0], param_ranges["S"][1])
-             
-             curr_sigma = sigma
-             if "sigma" in param_ranges:
-                 curr_sigma = np.random.uniform(param_ranges["sigma"][0], param_ranges["sigma"][1])
-                 
-             price = calculate_black_scholes(
-                 S=curr_S, 
-                 K=K, 
-                 T=T, 
-                 r=r, 
-                 sigma=curr_sigma, 
-                 option_type=option_type
-             )["price"]
-             results.append(price)
-             
+         # Sample every swept parameter as a length-n_sims array (fixed ones
+         # stay scalars and broadcast) and price the whole batch in one call
+         # (prices only, samples evaluated in parallel when Numba is available)
+         bs_params = {}
+         for name, default in (("S", 100.0), ("K", 100.0), ("T", 1.0), ("r", 0.05), ("sigma", 0.2), ("q", 0.0)):
+             if name in param_ranges:
+                 lo, hi = param_ranges[name]
+                 bs_params[name] = _rng.uniform(lo, hi, size=n_sims)
+             else:
+                 bs_params[name] = base_params.get(name, default)
+         
+         prices = calculate_black_scholes_price_batch(option_type=option_type, **bs_params)
+         results = np.broadcast_to(prices, (n_sims,))
+
     else:
         raise ValueError(f"Unknown model type: {model_type}")
 
     duration = time.time() - start_time
     
     # Compute Statistics
-    results_np = np.array(results)
+    results_np = np.asarray(results, dtype=np.float64)
     stats = {
         "mean": float(np.mean(results_np)),
         "std": float(np.std(results_np)),
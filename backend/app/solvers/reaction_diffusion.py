@@ -1,4 +1,119 @@
+from typing import Optional
+
 import numpy as np
+from backend.app.solvers._numba import NUMBA_AVAILABLE, njit, prange
+from backend.app.solvers._noise import noise_steps
+
+# Fields are stepped in float32: the update is memory-bound and the output is
+# only visualized, so half-width cells double cache residency and SIMD lanes
+_DTYPE = np.float32
+
+# |V| below this is flushed to zero so V and u*v*v stay clear of float32's
+# subnormal range; far below anything visible
+_V_FLOOR = _DTYPE(1e-15)
+
+# Steps between checks of U for NaN/inf
+_NAN_CHECK_EVERY = 100
+
+_NO_NOISE = np.zeros((0, 0), dtype=_DTYPE)
+
+
+@njit(fastmath=True, cache=True, inline="always")
+def _gray_scott_cell(U, V, U_next, V_next, i, im, ip, j, jm, jp, Du, Dv, F, Fk, dt, inv_dx2, noise_u, noise_v, has_noise, v_floor):
+    # Written without float literals: a 64-bit constant would promote the
+    # float32 arithmetic to double and stop vectorization
+    u = U[i, j]
+    v = V[i, j]
+    Lu = ((U[im, j] - u) + (U[ip, j] - u) + (U[i, jm] - u) + (U[i, jp] - u)) * inv_dx2
+    Lv = ((V[im, j] - v) + (V[ip, j] - v) + (V[i, jm] - v) + (V[i, jp] - v)) * inv_dx2
+    uv2 = u * v * v
+    u_new = u + (Du * Lu - uv2 + F - F * u) * dt
+    v_new = v + (Dv * Lv + uv2 - Fk * v) * dt
+    if has_noise:
+        u_new += noise_u[i, j]
+        v_new += noise_v[i, j]
+    # Flush V's diffusion tail to zero before it goes subnormal: subnormal
+    # float32 math is many times slower on x86 and Numba doesn't set FTZ/DAZ
+    if -v_floor < v_new < v_floor:
+        v_new = v_floor - v_floor
+    U_next[i, j] = u_new
+    V_next[i, j] = v_new
+
+
+# Explicit float32 signature (as in heat_fd): a stray float64 argument fails
+# loudly instead of compiling a double-precision specialization
+@njit(
+    "void(float32[:, ::1], float32[:, ::1], float32[:, ::1], float32[:, ::1], "
+    "float32, float32, float32, float32, float32, float32, "
+    "float32[:, ::1], float32[:, ::1], float32)",
+    parallel=True, fastmath=True, cache=True,
+)
+def _gray_scott_step(U, V, U_next, V_next, Du, Dv, F, k, dt, inv_dx2, noise_u, noise_v, v_floor):
+    """
+    One fused Euler(-Maruyama) step of Gray-Scott, (U, V) -> (U_next, V_next).
+    Periodic boundaries use wrapped indices (no np.roll temporaries); only the
+    first and last column wrap, leaving a branch-free inner loop.
+    """
+    nx, ny = U.shape
+    Fk = F + k
+    has_noise = noise_u.shape[0] > 0
+    for i in prange(nx):
+        im = i - 1 if i > 0 else nx - 1
+        ip = i + 1 if i < nx - 1 else 0
+        _gray_scott_cell(U, V, U_next, V_next, i, im, ip, 0, ny - 1, 1, Du, Dv, F, Fk, dt, inv_dx2, noise_u, noise_v, has_noise, v_floor)
+        for j in range(1, ny - 1):
+            _gray_scott_cell(U, V, U_next, V_next, i, im, ip, j, j - 1, j + 1, Du, Dv, F, Fk, dt, inv_dx2, noise_u, noise_v, has_noise, v_floor)
+        _gray_scott_cell(U, V, U_next, V_next, i, im, ip, ny - 1, ny - 2, 0, Du, Dv, F, Fk, dt, inv_dx2, noise_u, noise_v, has_noise, v_floor)
+
+
+def _laplacian_into(Z, out, inv_dx2):
+    """Periodic 5-point Laplacian of Z written into `out` (no np.roll copies)."""
+    np.multiply(Z, -4, out=out)
+    out[1:] += Z[:-1]
+    out[0] += Z[-1]
+    out[:-1] += Z[1:]
+    out[-1] += Z[0]
+    out[:, 1:] += Z[:, :-1]
+    out[:, 0] += Z[:, -1]
+    out[:, :-1] += Z[:, 1:]
+    out[:, -1] += Z[:, 0]
+    out *= inv_dx2
+
+
+def _gray_scott_step_numpy(U, V, U_next, V_next, Du, Dv, F, k, dt, inv_dx2, noise, Lu, Lv, uv2):
+    """
+    NumPy counterpart of `_gray_scott_step`: (U, V) -> (U_next, V_next).
+
+    Every intermediate goes into a preallocated buffer (Lu, Lv, uv2) or the
+    output arrays, so a step allocates nothing. `noise` is the (2, nx, ny)
+    pre-scaled noise or None.
+    """
+    _laplacian_into(U, Lu, inv_dx2)
+    _laplacian_into(V, Lv, inv_dx2)
+    np.multiply(V, V, out=uv2)
+    uv2 *= U
+
+    # U' = Du*Lu - U*V^2 + F*(1 - U), with U_next as scratch for the feed term
+    Lu *= Du
+    Lu -= uv2
+    np.multiply(U, -F, out=U_next)
+    U_next += F
+    Lu += U_next
+    np.multiply(Lu, dt, out=U_next)
+    U_next += U
+
+    # V' = Dv*Lv + U*V^2 - (F + k)*V
+    Lv *= Dv
+    Lv += uv2
+    np.multiply(V, F + k, out=V_next)
+    Lv -= V_next
+    np.multiply(Lv, dt, out=V_next)
+    V_next += V
+
+    if noise is not None:
+        U_next += noise[0]
+        V_next += noise[1]
+
 
 def solve_reaction_diffusion(
     Du: float,
@@ -13,8 +128,9 @@ def solve_reaction_diffusion(
     init_type: str = "random_center",
     width: int = 64, 
     height: int = 64,
-    current_u: list[list[float]] = None,
-    current_v: list[list[float]] = None
+    current_u: np.ndarray = None,
+    current_v: np.ndarray = None,
+    seed: Optional[int] = None,
 ):
     """
     Solves the 2D Gray-Scott Reaction-Diffusion System with Noise:
@@ -23,20 +139,24 @@ def solve_reaction_diffusion(
     
     Using Explicit Finite Difference (Forward Euler).
     Note: Stable only for small dt. 
+
+    `seed` seeds the generator used for both the initial perturbation and the
+    noise; None draws fresh entropy.
     """
+    rng = np.random.default_rng(seed)
     
     nx = width
     ny = height
     
     # Initialize fields
-    U = np.ones((nx, ny))
-    V = np.zeros((nx, ny))
+    U = np.ones((nx, ny), dtype=_DTYPE)
+    V = np.zeros((nx, ny), dtype=_DTYPE)
     
     # State Resumption from Infinite Loop
     if current_u is not None and current_v is not None:
-        # Convert list to numpy
-        resume_u = np.array(current_u)
-        resume_v = np.array(current_v)
+        # Accepts arrays or nested lists; copy so the caller's array isn't advanced in place
+        resume_u = np.array(current_u, dtype=_DTYPE)
+        resume_v = np.array(current_v, dtype=_DTYPE)
         
         # Verify shape
         if resume_u.shape == (nx, ny) and resume_v.shape == (nx, ny):
@@ -60,35 +180,25 @@ def solve_reaction_diffusion(
         y_start, y_end = max(0, cy-r), min(ny, cy+r)
         
         # Adjust random shape to match slice
-        u_noise = np.random.normal(0, 0.05, (x_end - x_start, y_end - y_start))
-        v_noise = np.random.normal(0, 0.05, (x_end - x_start, y_end - y_start))
+        u_noise = rng.normal(0, 0.05, (x_end - x_start, y_end - y_start))
+        v_noise = rng.normal(0, 0.05, (x_end - x_start, y_end - y_start))
         
         U[x_start:x_end, y_start:y_end] = 0.5 + u_noise
         V[x_start:x_end, y_start:y_end] = 0.25 + v_noise
     elif init_type == "random_everywhere":
-        U += np.random.normal(0, 0.05, (nx, ny))
-        V += np.random.normal(0, 0.05, (nx, ny))
+        U += rng.normal(0, 0.05, (nx, ny))
+        V += rng.normal(0, 0.05, (nx, ny))
     elif init_type == "spots":
         # Multiple random spots
         for _ in range(10):
-            rx, ry = np.random.randint(0, nx), np.random.randint(0, ny)
+            rx, ry = rng.integers(0, nx), rng.integers(0, ny)
             U[rx-2:rx+2, ry-2:ry+2] = 0.5
             V[rx-2:rx+2, ry-2:ry+2] = 0.25
             
     # Clip to valid range [0, 1] mainly for stability, but let dynamics handle it mostly
     
     nt = int(T / dt)
-    frames = []
     
-    # Laplacian kernel (5-point stencil)
-    # Using numpy roll for periodic BCs is fast and easy
-    def laplacian(Z):
-        return (
-            np.roll(Z, 1, axis=0) + np.roll(Z, -1, axis=0) +
-            np.roll(Z, 1, axis=1) + np.roll(Z, -1, axis=1) -
-            4 * Z
-        ) / (dx**2)
-
     # Sub-stepping? Explicit Euler for reaction-diffusion requires very small dt.
     # Gray-Scott typical parameters: Du=0.16, Dv=0.08, F=0.035, k=0.060.
     # Diffusive stability: D * dt / dx^2 < 0.25.
@@ -98,58 +208,64 @@ def solve_reaction_diffusion(
     # Precompute constants
     steps_per_frame = max(1, int(nt / 50)) # Limit output to ~50 frames max for 2D payload size
     
-    history_U = []
-    history_V = []
-    
-    t_vals = []
+    # Snapshot storage, preallocated: frames are saved at steps 0, steps_per_frame,
+    # 2 * steps_per_frame, ..., so the count and the times are known up front
+    n_saved = -(-nt // steps_per_frame)
+    history_U = np.empty((n_saved, nx, ny), dtype=_DTYPE)
+    history_V = np.empty((n_saved, nx, ny), dtype=_DTYPE)
+    t_vals = np.arange(n_saved) * steps_per_frame * dt
+    save_idx = 0
     
     accumulated_U = U.copy()
     accumulated_V = V.copy()
+
+    # Double buffers: each step writes the next state, then the references swap
+    next_U = np.empty_like(accumulated_U)
+    next_V = np.empty_like(accumulated_V)
+    if not NUMBA_AVAILABLE:
+        # Scratch for the NumPy step's Laplacians and reaction term
+        Lu, Lv, uv2 = (np.empty_like(accumulated_U) for _ in range(3))
+
+    # float32 scalars keep the arithmetic in single precision
+    Du_f, Dv_f, F_f, k_f, dt_f = (_DTYPE(v) for v in (Du, Dv, F, k, dt))
+    inv_dx2 = _DTYPE(1.0 / (dx * dx))
+
+    # Euler-Maruyama noise, dW ~ sqrt(dt) * N(0, 1), for U and V together:
+    # drawn in float32 blocks rather than per step (or per cell in the kernel)
+    noise_iter = None
+    if sigma > 0:
+        noise_iter = noise_steps(rng, nt, (2, nx, ny), _DTYPE(sigma * np.sqrt(dt)), dtype=_DTYPE)
     
     for i in range(nt):
-        Lu = laplacian(accumulated_U)
-        Lv = laplacian(accumulated_V)
-        
-        # Reaction terms
-        uv2 = accumulated_U * (accumulated_V ** 2)
-        
-        # Noise
-        noise_u = np.zeros((nx, ny))
-        noise_v = np.zeros((nx, ny))
-        if sigma > 0:
-            noise_u = np.random.normal(0, 1, (nx, ny)) * sigma * np.sqrt(dt)
-            noise_v = np.random.normal(0, 1, (nx, ny)) * sigma * np.sqrt(dt)
-        
-        # Update
-        # F(1-U) -> Feed
-        # -(F+k)V -> Kill
-        
-        # Deterministic Drift Step
-        du_dt = Du * Lu - uv2 + F * (1.0 - accumulated_U)
-        dv_dt = Dv * Lv + uv2 - (F + k) * accumulated_V
-        
-        accumulated_U += du_dt * dt
-        accumulated_V += dv_dt * dt
-        
-        # Stochastic Diffusion Step (Euler-Maruyama)
-        # dX = ... dt + sigma dW
-        # dW ~ N(0, dt) = sqrt(dt) * N(0, 1)
-        if sigma > 0:
-            accumulated_U += np.random.normal(0, 1, (nx, ny)) * sigma * np.sqrt(dt)
-            accumulated_V += np.random.normal(0, 1, (nx, ny)) * sigma * np.sqrt(dt)
+        noise = next(noise_iter) if noise_iter is not None else None
+        if NUMBA_AVAILABLE:
+            noise_u, noise_v = (noise[0], noise[1]) if noise is not None else (_NO_NOISE, _NO_NOISE)
+            _gray_scott_step(
+                accumulated_U, accumulated_V, next_U, next_V,
+                Du_f, Dv_f, F_f, k_f, dt_f, inv_dx2, noise_u, noise_v, _V_FLOOR
+            )
+        else:
+            _gray_scott_step_numpy(
+                accumulated_U, accumulated_V, next_U, next_V,
+                Du_f, Dv_f, F_f, k_f, dt_f, inv_dx2, noise, Lu, Lv, uv2
+            )
+        accumulated_U, next_U = next_U, accumulated_U
+        accumulated_V, next_V = next_V, accumulated_V
         
         # Clip to prevent numerical blowup?
         # Gray-Scott is usually bounded [0,1], but noise can push it out.
         # Let's not hard clip unless requested, but check for NaNs.
-        if np.any(np.isnan(accumulated_U)):
+        # A full scan of U costs as much as a step, so only check periodically
+        # (and after the last step): a blow-up stays non-finite once it starts
+        if ((i + 1) % _NAN_CHECK_EVERY == 0 or i == nt - 1) and not np.isfinite(accumulated_U).all():
             raise ValueError("Simulation unstable (NaN values detected). Try smaller dt.")
             
-        if i % steps_per_frame == 0:
-            history_U.append(accumulated_U.tolist()) # Heavy payload? 64x64 float is small.
+        if i == save_idx * steps_per_frame:
+            history_U[save_idx] = accumulated_U
             # Only storing U usually suffices for visualization (V is inverse-ish)
             # But let's verify visual. U is "food", V is "eater". V forms the pattern usually.
-            history_V.append(accumulated_V.tolist())
-            t_vals.append(i * dt)
+            history_V[save_idx] = accumulated_V
+            save_idx += 1
             
     return {
         "t": t_vals,
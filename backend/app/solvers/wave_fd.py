@@ -1,4 +1,183 @@
+import copy
+from typing import Optional, Sequence, Union
+
 import numpy as np
+from backend.app.solvers._numba import NUMBA_AVAILABLE, njit, prange
+
+# Interior points per _wave_step tile: three float64 buffers of this length
+# (96 KB) stay within L2, the float32 ones within half of it
+_TILE = 4096
+
+# float64 and float32 specializations, compiled eagerly at import as in heat_fd
+_STEP_SIGS = [
+    f"void({f}[:, ::1], {f}[:, ::1], {f}[:, ::1], {f}[:, ::1], {f}, {f}, {f}, {f}, {f}, "
+    f"float64, float64, float64, {f}[:, ::1], float64[::1])"
+    for f in ("float64", "float32")
+]
+_RUN_SIGS = [
+    f"UniTuple({f}[:, ::1], 3)({f}[:, ::1], {f}[:, ::1], {f}[:, ::1], {f}[:, :, ::1], int64, "
+    f"{f}, {f}, {f}, {f}, {f}, float64, float64, float64, float32[:, :, ::1], float64[:, ::1], int64, int64)"
+    for f in ("float64", "float32")
+]
+
+
+@njit(_STEP_SIGS, parallel=True, fastmath=True, cache=True)
+def _wave_step(u_prev, u_curr, u_next, noise, r2, prev_coef, inv_denom, force_scale, u_floor, dt, dx, c,
+               parts, energy):
+    """
+    One damped leapfrog step u_curr -> u_next for every path (row), with the
+    per-path energy written to `energy`. The interior is split into _TILE-point
+    (path, tile) jobs whose partial sums go through `parts`; the ends are never written.
+    """
+    n_paths, nx = u_curr.shape
+    has_noise = noise.shape[0] > 0
+    n_tiles = (nx - 2 + _TILE - 1) // _TILE
+    for job in prange(n_paths * n_tiles):
+        p = job // n_tiles
+        lo = 1 + (job - p * n_tiles) * _TILE
+        hi = min(lo + _TILE, nx - 1)
+        # Literal-free update and field-dtype sums keep float32 fields in float32
+        kin_b = u_curr[p, lo] - u_curr[p, lo]
+        pot_b = kin_b
+        for i in range(lo, hi):
+            ui = u_curr[p, i]
+            val = (ui + ui) - prev_coef * u_prev[p, i] + r2 * ((u_curr[p, i + 1] - ui) + (u_curr[p, i - 1] - ui))
+            if has_noise:
+                val += force_scale * noise[p, i]
+            val *= inv_denom
+            if -u_floor < val < u_floor:
+                val = u_floor - u_floor
+            u_next[p, i] = val
+            v = val - u_prev[p, i]
+            kin_b += v * v
+            s = u_curr[p, i + 1] - ui
+            pot_b += s * s
+        parts[0, job] = kin_b
+        parts[1, job] = pot_b
+    inv_2dt = 0.5 / dt
+    for p in range(n_paths):
+        # Forward difference at i = 0 is the one strain term outside the interior
+        s0 = u_curr[p, 1] - u_curr[p, 0]
+        kin = s0 - s0
+        pot = s0 * s0
+        for b in range(p * n_tiles, (p + 1) * n_tiles):
+            kin += parts[0, b]
+            pot += parts[1, b]
+        energy[p] = 0.5 * dx * (kin * inv_2dt * inv_2dt + c * c * pot / (dx * dx))
+
+
+# Serial time loop; each step's spatial loop is the parallel _wave_step
+@njit(_RUN_SIGS, fastmath=True, cache=True)
+def _wave_run(u_prev, u_curr, u_next, noise, n_steps, r2, prev_coef, inv_denom, force_scale, u_floor, dt, dx, c,
+              frames, energy, t0, snapshot_interval):
+    """
+    Advance `n_steps` steps from step t0, recording energies and every
+    snapshot_interval-th frame. Returns the rotated (u_prev, u_curr, u_next).
+    """
+    n_paths, nx = u_curr.shape
+    has_noise = noise.shape[0] > 0
+    no_noise = np.empty((0, 0), dtype=u_curr.dtype)
+    n_tiles = (nx - 2 + _TILE - 1) // _TILE
+    parts = np.empty((2, n_paths * n_tiles), dtype=u_curr.dtype)
+    for s in range(n_steps):
+        step_noise = noise[s] if has_noise else no_noise
+        _wave_step(
+            u_prev, u_curr, u_next, step_noise, r2, prev_coef, inv_denom, force_scale, u_floor, dt, dx, c,
+            parts, energy[t0 + s]
+        )
+        u_prev, u_curr, u_next = u_curr, u_next, u_prev
+        n = t0 + s + 1
+        if n % snapshot_interval == 0:
+            frames[n // snapshot_interval] = u_curr
+    return u_prev, u_curr, u_next
+
+
+# Noise values drawn per _wave_run call (8 MB of float64); bounds the
+# noise buffer for long runs on fine grids
+_NOISE_BLOCK_VALUES = 1 << 20
+
+# Flush-to-zero threshold per field dtype, like reaction_diffusion._V_FLOOR:
+# keeps float32 wave tails out of the subnormal range (0 disables it)
+_U_FLOOR = {np.dtype(np.float32): np.float32(1e-30), np.dtype(np.float64): np.float64(0.0)}
+
+
+def _integrate(u_prev, u_curr, u_next, rng, nt, r2_f, prev_coef, inv_denom, force_scale_f, dt, dx, c,
+               history, energy_history, snapshot_interval):
+    """
+    Step the (n_paths, nx) buffers `nt` times, filling history[1:] and
+    energy_history; `rng` is None for a deterministic run.
+    """
+    dtype = u_curr.dtype
+    n_paths, nx = u_curr.shape
+    if NUMBA_AVAILABLE:
+        # Whole runs of steps per kernel call: the time loop, buffer rotation
+        # and frame/energy writes all stay in compiled code. Noisy runs go in
+        # blocks so the pre-drawn noise stays bounded.
+        block = max(1, nt) if rng is None else max(1, _NOISE_BLOCK_VALUES // (n_paths * nx))
+        no_noise = np.zeros((0, 0, 0), dtype=dtype)
+        noise_buf = np.empty((min(block, nt), n_paths, nx), dtype=dtype) if rng is not None else no_noise
+        for t0 in range(0, nt, block):
+            n_steps = min(block, nt - t0)
+            noise = no_noise
+            if rng is not None:
+                noise = noise_buf[:n_steps]
+                rng.standard_normal(out=noise, dtype=dtype)
+            u_prev, u_curr, u_next = _wave_run(
+                u_prev, u_curr, u_next, noise, n_steps,
+                r2_f, prev_coef, inv_denom, force_scale_f, _U_FLOOR[dtype], dt, dx, c,
+                history, energy_history, t0, snapshot_interval
+            )
+    else:
+        noise = np.empty((n_paths, nx), dtype=dtype) if rng is not None else None
+        # Laplacian/scratch buffer and difference buffers for the energy,
+        # reused every step; the update is assembled in u_next with out= ops
+        d2u = np.empty((n_paths, nx - 2), dtype=dtype)
+        vel = np.empty((n_paths, nx - 2), dtype=dtype)
+        strain = np.empty((n_paths, nx - 1), dtype=dtype)
+        for t in range(nt):
+            # Stochastic force
+            if noise is not None:
+                rng.standard_normal(out=noise, dtype=dtype)
+            
+            # Interior views: the ends are never written (zero since init)
+            un, uc, up = u_next[:, 1:-1], u_curr[:, 1:-1], u_prev[:, 1:-1]
+            
+            # Laplacian
+            np.subtract(u_curr[:, 2:], uc, out=d2u)
+            d2u -= uc
+            d2u += u_curr[:, :-2]
+            
+            # Update rule (Central diff with damping)
+            # u_next * (1 + k/2) = 2*u_curr - u_prev*(1 - k/2) + r2 * d2u + sigma * noise * dt*dt
+            d2u *= r2_f
+            np.add(d2u, uc, out=un)
+            un += uc
+            np.multiply(up, prev_coef, out=d2u)
+            un -= d2u
+            if noise is not None:
+                force = noise[:, 1:-1]
+                force *= force_scale_f
+                un += force
+            un *= inv_denom
+            
+            # Energy Calculation (Hamiltonian approximation)
+            # E = 0.5 * integral( u_t^2 + c^2 u_x^2 ) dx
+            # Discrete: sum of (velocity^2 + c^2 * strain^2) * dx
+            # (the kernel accumulates the same sums in its update pass).
+            # Raw differences into the reused buffers, squared and summed per
+            # path by einsum; the 1/2dt and 1/dx scalings are applied to the sums
+            np.subtract(un, up, out=vel)
+            np.subtract(u_curr[:, 1:], u_curr[:, :-1], out=strain)
+            kin_en = 0.5 * dx * np.einsum("ij,ij->i", vel, vel) / (2*dt)**2
+            pot_en = 0.5 * (c**2) * dx * np.einsum("ij,ij->i", strain, strain) / dx**2
+            energy_history[t] = kin_en + pot_en
+            
+            # Rotate buffers: the oldest (u_prev) becomes the next step's output
+            u_prev, u_curr, u_next = u_curr, u_next, u_prev
+            
+            if (t + 1) % snapshot_interval == 0:
+                history[(t + 1) // snapshot_interval] = u_curr
+
 
 def solve_wave_equation(
     c: float,
@@ -9,8 +188,14 @@ def solve_wave_equation(
     dx: float,
     domain_len: float = 10.0,
     init_type: str = "pulse",
-    current_u: list[float] = None,
-    current_u_prev: list[float] = None
+    current_u: Optional[Union[Sequence[float], np.ndarray]] = None,
+    current_u_prev: Optional[Union[Sequence[float], np.ndarray]] = None,
+    seed: Optional[int] = None,
+    rng: Optional[np.random.Generator] = None,
+    dtype=np.float64,
+    snapshot_interval: int = 1,
+    antithetic: bool = False,
+    n_paths: int = 1,
 ):
     """
     Solves the 1D Stochastic Wave Equation:
@@ -18,30 +203,59 @@ def solve_wave_equation(
     
     Using Explicit Finite Difference (Leapfrog/Central difference in time).
     Stability condition (CFL): c * dt <= dx
+
+    `seed` seeds the PCG64 generator for the noise; None draws fresh entropy.
+    `rng`, if given, is drawn from instead (and advanced), so callers running
+    many realizations can share one generator rather than seeding one per call.
+    `dtype` is the precision the field is stepped in: float32 halves the
+    memory traffic of the (bandwidth-bound) stencil at an error far below the
+    discretization error.
+    `snapshot_interval` keeps every Nth step in "frames" (and "t"); the
+    energy is still recorded every step.
+    `antithetic` (noisy runs only) also runs the antithetic path, driven by
+    the negated noise, and returns it as "frames_antithetic" and
+    "energy_antithetic"; averaging statistics over the pair cuts their
+    variance at the cost of one extra run and no extra draws to store.
+    `n_paths` > 1 runs that many independent realizations from the same
+    initial state in one batched solve; frames are then (n_frames, n_paths,
+    nx) and energies (nt, n_paths).
+    `current_u` / `current_u_prev` resume from a saved state, given as lists
+    or arrays (1D, or (n_paths, nx) for a batch); arrays are copied directly.
     """
+    dtype = np.dtype(dtype)
     
     # Grid setup
     nx = int(domain_len / dx) + 1
     nt = int(T / dt)
     x = np.linspace(0, domain_len, nx)
     
+    if nx < 3:
+        raise ValueError(f"Grid too coarse: need at least 3 points, got {nx}. Decrease dx or increase domain_len.")
+
     # CFL Check
     cfl = c * dt / dx
     if cfl > 1.0:
         raise ValueError(f"Unstable: CFL condition violated (CFL={cfl:.4f} > 1.0). Decrease dt or increase dx.")
 
-    # Fields: u_new (n+1), u_curr (n), u_prev (n-1)
-    u_curr = np.zeros(nx)
-    u_prev = np.zeros(nx)
-    u_next = np.zeros(nx)
+    # Fields: u_new (n+1), u_curr (n), u_prev (n-1). A fresh start's u_prev
+    # is copied from the finished initial state below, not zero-filled first
+    # Each has one row per path; the initial state is broadcast across them
+    shape = (n_paths, nx)
+    u_curr = np.zeros(shape, dtype=dtype)
+    u_prev = np.zeros(shape, dtype=dtype) if current_u is not None else None
+    u_next = np.zeros(shape, dtype=dtype)
     
     # Initial Conditions
     if current_u is not None and current_u_prev is not None:
-        if len(current_u) != nx or len(current_u_prev) != nx:
+        # One conversion up front (none for arrays already in the field
+        # dtype); the copies below are then plain array copies
+        current_u = np.asarray(current_u, dtype=dtype)
+        current_u_prev = np.asarray(current_u_prev, dtype=dtype)
+        if current_u.shape[-1] != nx or current_u_prev.shape[-1] != nx:
              # Try to interpolate if size mismatch (e.g. if we want to change resolution mid-sim, though dangerous for stability)
              # For MVP, strict check or simple resize? Strict check.
-             if len(current_u) != nx:
-                  # raise ValueError(f"Grid size mismatch on resume. Expected {nx}, got {len(current_u)}")
+             if current_u.shape[-1] != nx:
+                  # raise ValueError(f"Grid size mismatch on resume. Expected {nx}, got {current_u.shape[-1]}")
                   # Re-interpolate for UX robustness if params changed slightly?
                   # Let's just raise for now or handle gracefully by resizing current params to match resume state?
                   # Actually usually params don't change dx/len. 
@@ -49,31 +263,48 @@ def solve_wave_equation(
         
         # If sizes match (or we ignore mismatch for robustness risk), copy
         # Ensure we take min length to avoid crash
-        n_copy = min(nx, len(current_u))
-        u_curr[:n_copy] = current_u[:n_copy]
+        # A 1D state is broadcast to every path; an (n_paths, nx) one
+        # resumes each path from its own row
+        n_copy = min(nx, current_u.shape[-1])
+        u_curr[:, :n_copy] = current_u[..., :n_copy]
         
-        n_copy_prev = min(nx, len(current_u_prev))
-        u_prev[:n_copy_prev] = current_u_prev[:n_copy_prev]
+        n_copy_prev = min(nx, current_u_prev.shape[-1])
+        u_prev[:, :n_copy_prev] = current_u_prev[..., :n_copy_prev]
         
     elif init_type == "pulse":
         # Gaussian pulse in the center
-        u_curr = np.exp(-((x - domain_len/2)**2) / 0.5)
+        u_curr[:] = np.exp(-((x - domain_len/2)**2) / 0.5)
         # Assuming initial velocity is zero, u_prev needs to be consistent
         # Taylor expansion: u(t-dt) = u(t) - u_t*dt + 0.5*u_tt*dt^2
         pass # u_prev will be set equal to u_curr below
     elif init_type == "string":
         # Plucked string (triangle)
         center = int(nx / 2)
-        u_curr[:center] = np.linspace(0, 1, center)
-        u_curr[center:] = np.linspace(1, 0, nx - center)
+        u_curr[:, :center] = np.linspace(0, 1, center)
+        u_curr[:, center:] = np.linspace(1, 0, nx - center)
         pass # u_prev equal to u_curr below
 
-    # If we didn't resume, set u_prev = u_curr (v=0 start)
+    # If we didn't resume, set u_prev = u_curr (v=0 start). It still needs its
+    # own buffer: the rotation makes u_prev the first step's output
     if current_u is None:
-        u_prev[:] = u_curr[:]
+        u_prev = u_curr.copy()
+
+    # Dirichlet BCs (fixed ends): zeroed once here; the steps only write the
+    # interior, and u_next is zero-initialized, so the ends stay zero
+    for u in (u_curr, u_prev):
+        u[:, 0] = 0
+        u[:, -1] = 0
     
-    history = [u_curr.tolist()]
-    energy_history = []
+    if snapshot_interval <= 0:
+        snapshot_interval = 1
+
+    # Preallocated storage: the initial state plus one frame every
+    # snapshot_interval steps. Frames are only displayed, so they are kept in
+    # float32 (half the memory and payload) whatever dtype is stepped
+    n_frames = nt // snapshot_interval + 1
+    history = np.empty((n_frames, n_paths, nx), dtype=np.float32)
+    history[0] = u_curr
+    energy_history = np.empty((nt, n_paths))
     
     # Precompute coefficients
     # Discretization: 
@@ -103,47 +334,50 @@ def solve_wave_equation(
     # Let's treat it as a force: u_tt = ... + sigma * xi(x,t)
     # in discrete: u_next += sigma * normal() * dt^2
     
-    for t in range(nt):
-        # Laplacian
-        d2u = np.zeros(nx)
-        d2u[1:-1] = u_curr[2:] - 2*u_curr[1:-1] + u_curr[:-2]
-        
-        # Stochastic force
-        noise = np.random.normal(0, 1, nx) if sigma > 0 else np.zeros(nx)
-        
-        # Update rule (Central diff with damping)
-        # u_next * (1 + k/2) = 2*u_curr - u_prev*(1 - k/2) + r2 * d2u + sigma * noise * dt*dt
-        forcing = sigma * noise * (dt**2)
-        
-        numerator = 2*u_curr - u_prev*(1 - k/2) + r2 * d2u + forcing
-        u_next = numerator / (1 + k/2)
-        
-        # Dirichlet BCs (Fixed ends)
-        u_next[0] = 0
-        u_next[-1] = 0
-        
-        # Energy Calculation (Hamiltonian approximation)
-        # E = 0.5 * integral( u_t^2 + c^2 u_x^2 ) dx
-        # Discrete: sum of (velocity^2 + c^2 * strain^2) * dx
-        
-        vel = (u_next - u_prev) / (2*dt)
-        strain = (u_curr[1:] - u_curr[:-1]) / dx
-        
-        kin_en = 0.5 * np.sum(vel[1:-1]**2) * dx
-        pot_en = 0.5 * (c**2) * np.sum(strain**2) * dx
-        total_en = kin_en + pot_en
-        energy_history.append(total_en)
-        
-        # Shift buffers
-        u_prev[:] = u_curr[:]
-        u_curr[:] = u_next[:]
-        
-        # Save frame (decimate if needed, but doing all for now as logic handled by API usually)
-        history.append(u_curr.tolist())
-        
-    return {
-        "x": x.tolist(),
-        "t": np.linspace(0, T, len(history)).tolist(),
+    force_scale = sigma * dt * dt
+    # Step coefficients in the fields' dtype so float32 arithmetic stays float32
+    r2_f, prev_coef, inv_denom, force_scale_f = (
+        dtype.type(v) for v in (r2, 1 - k/2, 1 / (1 + k/2), force_scale)
+    )
+    # Generator for the noise force (None for a deterministic run); a
+    # caller-supplied one is used as is, so sweeps share a single stream
+    if sigma <= 0:
+        rng = None
+    elif rng is None:
+        rng = np.random.default_rng(seed)
+    
+    paired = antithetic and rng is not None
+    if paired:
+        # The antithetic path replays the same draws with the force negated:
+        # keep its start state and a copy of the generator before stepping
+        start_b = (u_prev.copy(), u_curr.copy(), u_next.copy())
+        rng_b = copy.deepcopy(rng)
+
+    _integrate(
+        u_prev, u_curr, u_next, rng, nt, r2_f, prev_coef, inv_denom, force_scale_f, dt, dx, c,
+        history, energy_history, snapshot_interval
+    )
+    
+    if n_paths == 1:
+        # Single realization: drop the path axis (free reshapes of contiguous
+        # arrays) for the (n_frames, nx) frames and (nt,) energies callers expect
+        history = history.reshape(n_frames, nx)
+        energy_history = energy_history.reshape(nt)
+
+    result = {
+        "x": x,
+        "t": np.arange(n_frames) * (snapshot_interval * dt),
         "frames": history,
         "energy": energy_history
     }
+    if paired:
+        history_b = np.empty((n_frames, n_paths, nx), dtype=np.float32)
+        history_b[0] = start_b[1]
+        energy_b = np.empty((nt, n_paths))
+        _integrate(
+            *start_b, rng_b, nt, r2_f, prev_coef, inv_denom, -force_scale_f, dt, dx, c,
+            history_b, energy_b, snapshot_interval
+        )
+        result["frames_antithetic"] = history_b.reshape(history.shape)
+        result["energy_antithetic"] = energy_b.reshape(energy_history.shape)
+    return result
@@ -0,0 +1,91 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+
+from backend.app.solvers._numba import NUMBA_AVAILABLE
+from backend.app.solvers.black_scholes import calculate_black_scholes_price_batch
+from backend.app.solvers.gbm import simulate_gbm
+from backend.app.solvers.heat_fd import solve_heat
+from backend.app.solvers.reaction_diffusion import solve_reaction_diffusion
+from backend.app.solvers.wave_fd import solve_wave_equation
+
+# Process pool for CPU-bound solvers, so a long simulation does not hold the GIL
+# while other requests (pricing, history) are being served.
+_executor: Optional[ProcessPoolExecutor] = None
+
+# Solver kernels are multi-threaded themselves (Numba prange, numexpr), so the
+# pool is kept small and each worker gets an equal share of the cores: pool
+# size x threads per worker ~ cores, rather than cores workers each starting
+# cores threads under concurrent requests.
+_MAX_WORKERS = 4
+
+
+def warmup_in_process() -> None:
+    """
+    Load the JIT kernels the API process runs itself (GBM and the
+    Black-Scholes price kernel) from the on-disk Numba cache at startup.
+    """
+    calculate_black_scholes_price_batch(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+    simulate_gbm(S0=100.0, mu=0.05, sigma=0.2, T=0.02, dt=0.01, n_paths=1)
+
+
+def warmup() -> None:
+    """
+    Run each solver the pool serves once on a tiny input.
+
+    Kernels are compiled with cache=True, so this mostly loads them from the
+    on-disk Numba cache; either way the first real request skips compilation.
+    Called as the initializer of every pool worker.
+    """
+    calculate_black_scholes_price_batch(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+    solve_heat(alpha=0.1, dt=1e-3, dx=0.1, t_steps=2, sigma=0.1)
+    solve_wave_equation(c=1.0, damping=0.1, sigma=0.1, T=0.1, dt=0.05, dx=1.0, domain_len=5.0)
+    solve_reaction_diffusion(
+        Du=0.16, Dv=0.08, F=0.035, k=0.06, sigma=0.01, T=2.0, dt=1.0, dx=1.0, width=10, height=10
+    )
+
+
+def _init_worker(n_threads: int) -> None:
+    """Pool initializer: cap the worker's kernel threads, then warm up."""
+    if NUMBA_AVAILABLE:
+        import numba
+        numba.set_num_threads(min(n_threads, numba.config.NUMBA_NUM_THREADS))
+    try:
+        import numexpr
+    except ImportError:  # pragma: no cover - depends on the environment
+        pass
+    else:
+        numexpr.set_num_threads(n_threads)
+    warmup()
+
+
+def get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # "spawn" rather than fork: the parent already runs server and JIT threads, and
+        # forked workers would all inherit the same module-level RNG state.
+        cores = os.cpu_count() or 1
+        n_workers = min(_MAX_WORKERS, cores)
+        _executor = ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(max(1, cores // n_workers),),
+        )
+    return _executor
+
+
+def shutdown_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(cancel_futures=True)
+        _executor = None
+
+
+async def run_in_process(fn: Callable[..., Any], **kwargs: Any) -> Any:
+    """Run a top-level (picklable) solver in the process pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), partial(fn, **kwargs))
@@ -0,0 +1,7 @@
+import sys
+import os
+
+# Make `backend.app` importable whether pytest runs from the repo root or backend/.
+# Solvers import each other through `backend.app`, so tests must use the same
+# module path (Numba's on-disk kernel cache is keyed to it).
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
@@ -0,0 +1,31 @@
+import base64
+
+import numpy as np
+import pytest
+from backend.app.encoding import decode_array
+
+def test_decode_base64_float32():
+    grid = np.arange(12, dtype=np.float32).reshape(3, 4) / 7
+    encoded = base64.b64encode(grid.astype("<f4").tobytes()).decode()
+    decoded = decode_array(encoded, (3, 4))
+    assert decoded.dtype == np.float64
+    assert np.array_equal(decoded, grid.astype(np.float64))
+
+def test_decode_list_passthrough():
+    assert np.array_equal(decode_array([[1, 2], [3, 4]]), np.array([[1.0, 2.0], [3.0, 4.0]]))
+
+def test_decode_rejects_bad_input():
+    with pytest.raises(ValueError):
+        decode_array("not base64!")
+    with pytest.raises(ValueError):
+        decode_array(base64.b64encode(np.zeros(5, dtype="<f4").tobytes()).decode(), (2, 2))
+
+def test_decode_shape_envelope():
+    grid = np.linspace(0, 1, 6, dtype=np.float32).reshape(2, 3)
+    envelope = {"shape": [2, 3], "data": base64.b64encode(grid.astype("<f4").tobytes()).decode()}
+    assert np.array_equal(decode_array(envelope), grid.astype(np.float64))
+    assert decode_array(envelope, (2, 3)).shape == (2, 3)
+    with pytest.raises(ValueError):
+        decode_array(envelope, (3, 2))
+    with pytest.raises(ValueError):
+        decode_array({"data": envelope["data"]})
@@ -1,6 +1,6 @@
 import pytest
 import numpy as np
-from app.solvers.gbm import simulate_gbm
+from backend.app.solvers.gbm import simulate_gbm
 
 def test_gbm_basic_simulation():
     result = simulate_gbm(S0=100, mu=0.05, sigma=0.2, T=1.0, dt=0.01, n_paths=1)
@@ -28,3 +28,13 @@ def test_gbm_validation():
         simulate_gbm(S0=-100, mu=0.05, sigma=0.2, T=1.0, dt=0.01)
     with pytest.raises(ValueError):
         simulate_gbm(S0=100, mu=0.05, sigma=-0.2, T=1.0, dt=0.01)
+
+def test_gbm_numpy_fallback(monkeypatch):
+    # Without Numba the solver must take the pure NumPy cumprod path
+    import backend.app.solvers.gbm as gbm
+    monkeypatch.setattr(gbm, "NUMBA_AVAILABLE", False)
+    S0, mu, T = 100, 0.1, 1.0
+    result = gbm.simulate_gbm(S0=S0, mu=mu, sigma=0.0, T=T, dt=0.1, n_paths=3)
+    assert result["paths"].shape == (3, 11)
+    assert result["paths"][0][0] == 100.0
+    assert np.isclose(result["paths"][0][-1], S0 * np.exp(mu * T), atol=1e-2)
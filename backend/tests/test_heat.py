@@ -5,6 +5,7 @@ import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from backend.app.solvers.heat_fd import solve_heat
+import numpy as np
 import pytest
 
 def test_heat_basic():
@@ -48,6 +49,24 @@ def test_stochastic_reproducibility():
     # Note: extremely small chance they are same, but practically impossible
     assert f1 != f2
 
+def test_numpy_fallback_matches_kernel(monkeypatch):
+    import backend.app.solvers.heat_fd as heat_fd
+    kernel = solve_heat(alpha=0.5, dt=0.0001, dx=0.01, t_steps=50, domain=1.0, init="pulse")
+    monkeypatch.setattr(heat_fd, "NUMBA_AVAILABLE", False)
+    fallback = heat_fd.solve_heat(alpha=0.5, dt=0.0001, dx=0.01, t_steps=50, domain=1.0, init="pulse")
+    assert np.allclose(kernel["frames"], fallback["frames"], atol=1e-12)
+
+def test_seeded_noise_is_reproducible(monkeypatch):
+    import backend.app.solvers.heat_fd as heat_fd
+    kwargs = dict(alpha=0.5, dt=0.0001, dx=0.1, t_steps=10, domain=1.0, sigma=1.0, seed=7)
+    r1 = solve_heat(**kwargs)
+    r2 = solve_heat(**kwargs)
+    assert r1["frames"] == r2["frames"]
+    # Both paths consume the same pre-drawn noise
+    monkeypatch.setattr(heat_fd, "NUMBA_AVAILABLE", False)
+    fallback = heat_fd.solve_heat(**kwargs)
+    assert np.allclose(r1["frames"], fallback["frames"], atol=1e-12)
+
 if __name__ == "__main__":
     # If run directly, run the tests manually and print success
     try:
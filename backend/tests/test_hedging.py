@@ -1,6 +1,6 @@
 import pytest
 import numpy as np
-from app.solvers.hedging import simulate_delta_hedging
+from backend.app.solvers.hedging import simulate_delta_hedging
 
 def test_hedging_basic():
     res = simulate_delta_hedging(
@@ -41,3 +41,21 @@ def test_short_put_hedging():
     # shares_held = curr_delta. For Put, this is (N(d1)-1), which is negative.
     # So we hold negative shares (short stock). Correct.
     assert res["delta"][0] < 0 
+
+def test_vectorized_cash_matches_stepwise_recurrence():
+    r, q, dt = 0.05, 0.02, 1 / 252.0
+    res = simulate_delta_hedging(
+        S0=100, K=95, T=0.5, r=r, sigma=0.25, mu=0.1, q=q, option_type="call"
+    )
+    S, opt, delta = (np.array(res[k]) for k in ("stock_price", "option_price", "delta"))
+    N = len(S) - 1
+
+    # Reference: the original per-step cash account
+    cash = opt[0] - delta[0] * S[0]
+    shares = delta[0]
+    for i in range(1, N + 1):
+        cash = cash * np.exp(r * dt) + shares * S[i - 1] * (np.exp(q * dt) - 1)
+        if i < N:
+            cash -= (delta[i] - shares) * S[i]
+            shares = delta[i]
+    assert np.isclose(res["pnl"][-1], shares * S[N] + cash - opt[N], atol=1e-9)
@@ -1,6 +1,10 @@
 import pytest
 import numpy as np
-from app.solvers.black_scholes import calculate_black_scholes
+from backend.app.solvers.black_scholes import (
+    calculate_black_scholes,
+    calculate_black_scholes_batch,
+    calculate_black_scholes_price_batch,
+)
 
 def test_bs_call_pricing():
     # Benchmark: S=100, K=100, T=1, r=0.05, sigma=0.2
@@ -52,3 +56,75 @@ def test_deep_itm_otm():
     # Deep OTM Call (S << K) -> Delta -> 0
     res = calculate_black_scholes(S=50, K=100, T=1, r=0.05, sigma=0.2, option_type="call")
     assert np.isclose(res["delta"], 0.0, atol=0.01)
+
+def test_deep_otm_put_not_negative():
+    for sigma in (0.1, 0.15, 0.2, 0.3):
+        for S in np.linspace(150.0, 1000.0, 400):
+            res = calculate_black_scholes(S=S, K=100, T=1, r=0.05, sigma=sigma, option_type="put")
+            assert res["price"] >= 0.0
+
+def test_cached_result_not_shared():
+    # Repeated calls hit the LRU cache; mutating one result must not leak into the next
+    first = calculate_black_scholes(S=100, K=100, T=1, r=0.05, sigma=0.2, option_type="call")
+    first["price"] = -1.0
+    second = calculate_black_scholes(S=100, K=100, T=1, r=0.05, sigma=0.2, option_type="call")
+    assert np.isclose(second["price"], 10.45, atol=0.01)
+
+def test_tiny_inputs_not_rounded_away():
+    # The cache key must not change the inputs: a tiny sigma is still valid and
+    # a tiny T is priced by the formula, not as intrinsic value
+    res = calculate_black_scholes(S=100, K=100, T=1, r=0.05, sigma=1e-9, option_type="call")
+    assert np.isclose(res["price"], 100 - 100 * np.exp(-0.05), atol=1e-6)
+    res = calculate_black_scholes(S=100, K=100, T=1e-9, r=0.0, sigma=0.2, option_type="call")
+    assert res["price"] > 0
+
+def test_batch_matches_scalar():
+    S = np.array([80.0, 100.0, 120.0])
+    sigma = np.array([0.1, 0.2, 0.4])
+    for option_type in ("call", "put"):
+        batch = calculate_black_scholes_batch(S=S, K=100, T=0.5, r=0.03, sigma=sigma, q=0.01, option_type=option_type)
+        for i in range(len(S)):
+            scalar = calculate_black_scholes(S=S[i], K=100, T=0.5, r=0.03, sigma=sigma[i], q=0.01, option_type=option_type)
+            for greek, value in scalar.items():
+                assert np.isclose(batch[greek][i], value, rtol=1e-9, atol=1e-12)
+
+def test_batch_numexpr_path_matches_numpy(monkeypatch):
+    from backend.app.solvers import black_scholes
+    pytest.importorskip("numexpr")
+    S = np.linspace(50.0, 150.0, 101)
+    expected = calculate_black_scholes_batch(S=S, K=100, T=1.0, r=0.05, sigma=0.25, q=0.02, option_type="put")
+    monkeypatch.setattr(black_scholes, "_NUMEXPR_MIN_SIZE", 1)
+    fused = calculate_black_scholes_batch(S=S, K=100, T=1.0, r=0.05, sigma=0.25, q=0.02, option_type="put")
+    for greek in expected:
+        assert np.allclose(fused[greek], expected[greek], rtol=1e-12, atol=1e-12)
+
+def test_batch_fast_math_close_to_exact():
+    S = np.linspace(60.0, 140.0, 41)
+    for option_type in ("call", "put"):
+        exact = calculate_black_scholes_batch(S=S, K=100, T=0.75, r=0.04, sigma=0.3, option_type=option_type)
+        fast = calculate_black_scholes_batch(S=S, K=100, T=0.75, r=0.04, sigma=0.3, option_type=option_type, fast_math=True)
+        assert np.allclose(fast["price"], exact["price"], atol=1e-5)
+        assert np.allclose(fast["delta"], exact["delta"], atol=1e-6)
+
+def test_price_batch_matches_batch():
+    S = np.linspace(60.0, 140.0, 41)
+    sigma = np.linspace(0.1, 0.5, 41)
+    for option_type in ("call", "put"):
+        expected = calculate_black_scholes_batch(S=S, K=100, T=0.75, r=0.04, sigma=sigma, q=0.01, option_type=option_type)
+        prices = calculate_black_scholes_price_batch(S=S, K=100, T=0.75, r=0.04, sigma=sigma, q=0.01, option_type=option_type)
+        assert np.allclose(prices, expected["price"], rtol=1e-12, atol=1e-12)
+    with pytest.raises(ValueError):
+        calculate_black_scholes_price_batch(S=S, K=100, T=0.75, r=0.04, sigma=0.0)
+
+def test_batch_expired_is_intrinsic():
+    # T <= 0 rows get intrinsic value, as in the scalar path
+    S = np.array([80.0, 100.0, 120.0, 120.0])
+    T = np.array([0.0, 0.5, 0.0, -1.0])
+    for option_type in ("call", "put"):
+        batch = calculate_black_scholes_batch(S=S, K=100, T=T, r=0.03, sigma=0.2, option_type=option_type)
+        prices = calculate_black_scholes_price_batch(S=S, K=100, T=T, r=0.03, sigma=0.2, option_type=option_type)
+        for i in range(len(S)):
+            scalar = calculate_black_scholes(S=S[i], K=100, T=T[i], r=0.03, sigma=0.2, option_type=option_type)
+            for greek, value in scalar.items():
+                assert np.isclose(batch[greek][i], value, rtol=1e-9, atol=1e-12)
+            assert np.isclose(prices[i], scalar["price"], rtol=1e-9, atol=1e-12)
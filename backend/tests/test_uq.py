@@ -1,4 +1,5 @@
 
+import numpy as np
 import pytest
 from backend.app.solvers.monte_carlo import run_parameter_sweep
 
@@ -14,6 +15,15 @@ def test_sweep_gbm_simple():
     # But Monte Carlo has variance.
     assert 90 < res["stats"]["mean"] < 120
 
+def test_sweep_gbm_sigma_sensitivity():
+    """Sampled sigma: E[S_T] = S0 * exp(mu * T) whatever the volatility."""
+    base_params = {"S0": 100, "mu": 0.05, "sigma": 0.2, "T": 1.0, "dt": 0.01}
+    res = run_parameter_sweep("gbm", base_params, {"sigma": [0.1, 0.3]}, n_sims=10000)
+
+    assert len(res["outcomes"]) == 10000
+    assert res["stats"]["min"] > 0
+    assert abs(res["stats"]["mean"] - 100 * np.exp(0.05)) < 1.5
+
 def test_sweep_pricing_sensitivity():
     """Test Option Pricing sensitivity (variable params, deterministic function)."""
     base_params = {"S": 100, "K": 100, "T": 1.0, "r": 0.05, "option_type": "call"}
@@ -27,6 +37,26 @@ def test_sweep_pricing_sensitivity():
     assert res["stats"]["min"] < res["stats"]["max"]
     assert res["stats"]["min"] > 0 # Call price > 0
 
+def test_sweep_pricing_any_parameter():
+    """Every Black-Scholes input can be swept, not just S and sigma."""
+    base_params = {"S": 100, "K": 100, "T": 1.0, "r": 0.05, "sigma": 0.2, "option_type": "put"}
+    ranges = {"K": [90, 110], "T": [0.5, 2.0], "r": [0.0, 0.05], "q": [0.0, 0.02]}
+
+    res = run_parameter_sweep("pricing", base_params, ranges, n_sims=1000)
+
+    assert len(res["outcomes"]) == 1000
+    assert 0 < res["stats"]["min"] < res["stats"]["max"]
+
+def test_sweep_pricing_expired():
+    """T = 0 prices at intrinsic value instead of failing."""
+    base_params = {"S": 100, "K": 100, "T": 0.0, "r": 0.05, "sigma": 0.2, "option_type": "call"}
+    res = run_parameter_sweep("pricing", base_params, {"S": [90, 110]}, n_sims=500)
+
+    outcomes = np.asarray(res["outcomes"])
+    assert len(outcomes) == 500
+    assert res["stats"]["min"] == 0.0
+    assert np.all(outcomes <= 10.0)
+
 def test_sweep_invalid_model():
     with pytest.raises(ValueError):
         run_parameter_sweep("unknown", {}, {})
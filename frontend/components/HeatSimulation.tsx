@@ -2,7 +2,7 @@
 
 import React, { useState, useEffect, useRef, useCallback } from 'react';
 import dynamic from 'next/dynamic';
-import { solveHeatEquation, HeatInput } from '../lib/api';
+import { encodeFloat32, solveHeatEquation, HeatInput } from '../lib/api';
 import { PREMIUM_CHART_LAYOUT, PREMIUM_CHART_CONFIG, CHART_COLORS } from '../lib/chartConfig';
 import Methodology from './Methodology';
 
@@ -90,7 +90,7 @@ export default function HeatSimulation({ isActive }: HeatSimulationProps) {
             }
 
             if (startState) {
-                input.current_state = startState;
+                input.current_state = encodeFloat32(startState);
             }
 
             const data = await solveHeatEquation(input);
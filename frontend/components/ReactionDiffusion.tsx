@@ -2,7 +2,7 @@
 
 import React, { useState, useEffect, useRef, useCallback } from 'react';
 import dynamic from 'next/dynamic';
-import { solveReaction, ReactionInput } from '../lib/api';
+import { encodeFloat32, solveReaction, ReactionInput } from '../lib/api';
 import { PREMIUM_CHART_LAYOUT, PREMIUM_CHART_CONFIG } from '../lib/chartConfig';
 import Methodology from './Methodology';
 
@@ -70,8 +70,8 @@ export default function ReactionDiffusion({ isActive }: ReactionDiffusionProps)
     const fetchBatch = useCallback(async (startU?: number[][], startV?: number[][]) => {
         try {
             const input: ReactionInput = { ...params };
-            if (startU) input.current_u = startU;
-            if (startV) input.current_v = startV;
+            if (startU) input.current_u = encodeFloat32(startU);
+            if (startV) input.current_v = encodeFloat32(startV);
 
             // Limit T if resuming to avoid massive payloads
             // input.T = 100.0; 
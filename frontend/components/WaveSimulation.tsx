@@ -2,7 +2,7 @@
 
 import React, { useState, useEffect, useRef, useCallback } from 'react';
 import dynamic from 'next/dynamic';
-import { solveWave, WaveInput } from '../lib/api';
+import { encodeFloat32, solveWave, WaveInput } from '../lib/api';
 import { PREMIUM_CHART_LAYOUT, PREMIUM_CHART_CONFIG, CHART_COLORS } from '../lib/chartConfig';
 import Methodology from './Methodology';
 
@@ -74,8 +74,8 @@ export default function WaveSimulation({ isActive }: WaveSimulationProps) {
     const fetchBatch = async (startU?: number[], startUPrev?: number[]) => {
         try {
             const input: WaveInput = { ...params };
-            if (startU) input.current_u = startU;
-            if (startUPrev) input.current_u_prev = startUPrev;
+            if (startU) input.current_u = encodeFloat32(startU);
+            if (startUPrev) input.current_u_prev = encodeFloat32(startUPrev);
 
             // Validate T / dt isn't too huge
             if (input.T > 20) input.T = 20; // Cap chunk size
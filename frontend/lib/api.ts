@@ -2,6 +2,23 @@ import axios from 'axios';
 
 export const API_BASE_URL = 'http://127.0.0.1:8000/api/v1';
 
+// Resume-state envelope: raw little-endian float32 bytes (base64) plus the
+// field's shape, half the size of a JSON float list and decoded server-side
+// in one copy.
+export type EncodedArray = { shape: number[]; data: string };
+
+export const encodeFloat32 = (values: number[] | number[][]): EncodedArray => {
+    const is2d = Array.isArray(values[0]);
+    const flat = is2d ? (values as number[][]).flat() : (values as number[]);
+    const shape = is2d ? [values.length, (values as number[][])[0].length] : [values.length];
+    const bytes = new Uint8Array(Float32Array.from(flat).buffer);
+    let binary = '';
+    for (let i = 0; i < bytes.length; i += 0x8000) {
+        binary += String.fromCharCode(...bytes.subarray(i, i + 0x8000));
+    }
+    return { shape, data: btoa(binary) };
+};
+
 export type HeatInput = {
     alpha: number;
     dt: number;
@@ -9,7 +26,7 @@ export type HeatInput = {
     t_steps: number;
     domain: number;
     init: "pulse" | "sin" | "random";
-    current_state?: number[];
+    current_state?: number[] | EncodedArray;
     sigma: number;
     snapshot_interval: number;
 };
@@ -82,8 +99,8 @@ export type WaveInput = {
     dx: number;
     domain_len: number;
     init_type: "pulse" | "string";
-    current_u?: number[];
-    current_u_prev?: number[];
+    current_u?: number[] | EncodedArray;
+    current_u_prev?: number[] | EncodedArray;
 };
 
 export type WaveResponse = {
@@ -155,8 +172,8 @@ export type ReactionInput = {
     width: number;
     height: number;
     init_type: "random_center" | "random_everywhere" | "spots" | "center" | "random";
-    current_u?: number[][];
-    current_v?: number[][];
+    current_u?: number[][] | EncodedArray;
+    current_v?: number[][] | EncodedArray;
 };
 
 export type ReactionResponse = {